@@ -1,31 +1,43 @@
 import sqlite3
 from prettytable import PrettyTable
 
+# maximum number of rows printed per query
+MAX_DISPLAY = 1000
 
-def run_query(db_path, query):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+
+def run_query(conn, query):
     try:
-        cursor.execute(query)
-        results = cursor.fetchall()
+        cursor = conn.execute(query)
 
-        # Display results in table format
+        # Display results in table format; at most MAX_DISPLAY rows are read
+        # so large result sets are never fully materialized
         table = PrettyTable()
         table.field_names = [desc[0] for desc in cursor.description]
-        table.add_rows(results)
+        # one extra row tells us whether there was more, without reading the rest
+        rows = cursor.fetchmany(MAX_DISPLAY + 1)
+        table.add_rows(rows[:MAX_DISPLAY])
         print(table)
 
+        if len(rows) > MAX_DISPLAY:
+            print("(output truncated)")
+
     except sqlite3.Error as e:
         print(f"Error: {str(e)}")
-    finally:
-        conn.close()
 
 
 if __name__ == "__main__":
     # db_path = input("Database path: ")
     db_path = "data/games.db"
-    while True:
-        query = input("\nSQL> ")
-        if query.lower() in ("exit", "quit"):
-            break
-        run_query(db_path, query)
+    # keep one connection for the session so the page cache stays warm
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA cache_size=-65536")
+    try:
+        while True:
+            query = input("\nSQL> ")
+            if query.lower() in ("exit", "quit"):
+                break
+            run_query(conn, query)
+    except (KeyboardInterrupt, EOFError):
+        pass
+    finally:
+        conn.close()
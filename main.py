@@ -13,64 +13,136 @@ from telegram_bot.handlers import (
     create_start_handler,
     create_help_handler,
     create_deletegame_handler,
+    create_unblock_handler,
 )
 from telegram_bot.scheduled_tasks import schedule_weekly_roundup
+from telegram_bot.stats.leaderboard import shutdown_image_pool
 
-from telegram.ext import Application
+from telegram.ext import Application, Defaults, PicklePersistence
+from telegram.request import HTTPXRequest
 import dotenv
+import httpx
 import os
+import atexit
 import logging
+import logging.handlers
+import queue
 
-# Set up logging
-logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
-)
 
-dotenv.load_dotenv()
+def setup_logging() -> None:
+    """Hand log records to a queue drained by a listener thread, so logging
+    never blocks the event loop on stream I/O."""
+    log_queue = queue.Queue(-1)
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        level=logging.INFO,
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+        force=True,
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
 
-# make a directory for data if not already there:
-os.makedirs("data", exist_ok=True)
 
-game_manager = GameManager(
-    db_url="sqlite:///data/games.db", db_salt=os.getenv("DATABASE_SALT")
-)
+async def _post_shutdown(application: Application) -> None:
+    # leaderboard render workers would otherwise outlive the bot
+    shutdown_image_pool()
 
-# Create the handlers
-start_command = create_start_handler()
-help_command = create_help_handler()
-delete_command = create_deletegame_handler(game_manager)
-profile_conversation = create_profile_conversation(game_manager)
-game_conversation = create_game_conversation(game_manager)
-custom_game_conversation = create_custom_game_conversation(game_manager)
-history_command = create_history_conversation(game_manager)
-pod_conversation = create_pod_conversation(game_manager)
-leaderboard_conversation, leaderboard_callback = create_leaderboard_conversation(
-    game_manager
-)
-pod_history_conversation = create_pod_history_conversation(game_manager)
-edit_profile_conversation = create_edit_profile_conversation(game_manager)
+
+def build_application(game_manager: GameManager) -> Application:
+    """Build the bot application and register all handlers."""
+    leaderboard_conversation, leaderboard_callback = create_leaderboard_conversation(
+        game_manager
+    )
+    handlers = [
+        create_start_handler(),
+        create_help_handler(),
+        create_deletegame_handler(game_manager),
+        create_profile_conversation(game_manager),
+        create_game_conversation(game_manager),
+        create_custom_game_conversation(game_manager),
+        create_history_conversation(game_manager),
+        create_pod_conversation(game_manager),
+        leaderboard_conversation,
+        leaderboard_callback,
+        create_pod_history_conversation(game_manager),
+        create_edit_profile_conversation(game_manager),
+    ]
+
+    # in-progress conversations (and their user_data) are flushed to disk
+    # periodically so a restart doesn't drop everyone mid-game
+    persistence = PicklePersistence(
+        filepath=os.getenv("PERSISTENCE_PATH", "data/bot_state.pickle"),
+        update_interval=60,
+    )
+
+    # every handler shares the bot's connection pool to api.telegram.org; idle
+    # connections are kept open for a minute (httpx drops them after 5s by
+    # default) so bursts of sends after a quiet spell reuse existing TLS sessions
+    request = HTTPXRequest(
+        connection_pool_size=256,
+        pool_timeout=1,
+        httpx_kwargs={
+            "limits": httpx.Limits(
+                max_connections=256,
+                max_keepalive_connections=256,
+                keepalive_expiry=60,
+            )
+        },
+    )
+
+    # handlers run as independent tasks by default so a slow DB query or image
+    # render for one user doesn't hold up everyone else's updates
+    application = (
+        Application.builder()
+        .token(os.getenv("TELEGRAM_BOT_TOKEN"))
+        .request(request)
+        .concurrent_updates(True)
+        .defaults(Defaults(block=False))
+        .persistence(persistence)
+        .post_shutdown(_post_shutdown)
+        .build()
+    )
+
+    application.add_handlers(handlers)
+    # runs ahead of the handlers above so any private update clears a blocked mark
+    application.add_handler(create_unblock_handler(game_manager), group=-1)
+
+    # Schedule weekly roundup
+    schedule_weekly_roundup(application, game_manager)
+
+    return application
 
 
-# build application
-application = Application.builder().token(os.getenv("TELEGRAM_BOT_TOKEN")).build()
+def main() -> None:
+    # make a directory for data if not already there:
+    os.makedirs("data", exist_ok=True)
 
+    game_manager = GameManager(
+        db_url="sqlite:///data/games.db", db_salt=os.getenv("DATABASE_SALT")
+    )
+    application = build_application(game_manager)
 
-# Add handlers
-application.add_handler(start_command)
-application.add_handler(help_command)
-application.add_handler(delete_command)
-application.add_handler(profile_conversation)
-application.add_handler(game_conversation)
-application.add_handler(custom_game_conversation)
-application.add_handler(history_command)
-application.add_handler(pod_conversation)
-application.add_handler(leaderboard_conversation)
-application.add_handler(leaderboard_callback)
-application.add_handler(pod_history_conversation)
-application.add_handler(edit_profile_conversation)
+    # Start the bot
+    # Webhooks are used when a public base URL is configured; otherwise fall back
+    # to polling (e.g. for local development)
+    webhook_base = os.getenv("WEBHOOK_BASE")
+    if webhook_base and not os.getenv("USE_POLLING"):
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=int(os.getenv("PORT", 8443)),
+            url_path=os.getenv("TELEGRAM_BOT_TOKEN"),
+            webhook_url=f"{webhook_base}/{os.getenv('TELEGRAM_BOT_TOKEN')}",
+            secret_token=os.getenv("WEBHOOK_SECRET"),
+        )
+    else:
+        # long-poll getUpdates so idle periods don't turn into a stream of empty requests
+        application.run_polling(timeout=30)
 
-# Schedule weekly roundup
-schedule_weekly_roundup(application, game_manager)
 
-# Start the bot
-application.run_polling()
+# setup stays out of module scope: render workers are spawned processes that
+# re-import this file as __mp_main__
+if __name__ == "__main__":
+    setup_logging()
+    dotenv.load_dotenv()
+    main()
@@ -1,30 +1,42 @@
-from hashids import Hashids
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
+from pathlib import Path
+import importlib.util
 import dotenv
-import os
 
+# load .env before encoding anything: encode_ref reads DATABASE_SALT on first use
 dotenv.load_dotenv()
 
-# Use the same salt as in your application
-hashids = Hashids(salt=os.getenv("DATABASE_SALT"), min_length=6)
+# load the deletion reference helpers straight from their file, so the rest of
+# telegram_bot.utils (telegram, avatar storage, ...) isn't imported for a backfill
+_spec = importlib.util.spec_from_file_location(
+    "deletion_reference",
+    Path(__file__).resolve().parents[2]
+    / "telegram_bot"
+    / "utils"
+    / "deletion_reference.py",
+)
+deletion_reference = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(deletion_reference)
+encode_ref = deletion_reference.encode_ref
 
 engine = create_engine("sqlite:///data/games.db")
 Session = sessionmaker(bind=engine)
 session = Session()
 
-# Get all existing games without deletion references
-games = session.execute(
-    text("SELECT game_id FROM games WHERE deletion_reference IS NULL")
-).fetchall()
+with session.begin():
+    # Get all existing games without deletion references
+    games = session.execute(
+        text("SELECT game_id FROM games WHERE deletion_reference IS NULL")
+    ).fetchall()
 
-for (game_id,) in games:
-    deletion_ref = hashids.encode(game_id)
-    session.execute(
-        text("UPDATE games SET deletion_reference = :ref WHERE game_id = :id"),
-        {"ref": deletion_ref, "id": game_id},
-    )
+    # single executemany in one transaction rather than one UPDATE per row
+    rows = [{"ref": encode_ref(game_id), "id": game_id} for (game_id,) in games]
+    if rows:
+        session.execute(
+            text("UPDATE games SET deletion_reference = :ref WHERE game_id = :id"),
+            rows,
+        )
 
-session.commit()
 session.close()
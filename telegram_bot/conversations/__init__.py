@@ -1,13 +1,23 @@
 """Conversation handlers for the bot."""
 
-from telegram_bot.conversations.profile import create_profile_conversation
-from telegram_bot.conversations.add_custom_game import create_custom_game_conversation
-from telegram_bot.conversations.add_game import create_game_conversation
-from telegram_bot.conversations.history import create_history_conversation
-from telegram_bot.conversations.pod import create_pod_conversation
-from telegram_bot.conversations.leaderboard import create_leaderboard_conversation
-from telegram_bot.conversations.pod_history import create_pod_history_conversation
-from telegram_bot.conversations.edit_profile import create_edit_profile_conversation
+import importlib
+
+# seconds of inactivity before a conversation is ended and its state dropped;
+# game recording keeps its original, shorter window
+CONVERSATION_TIMEOUT = 600
+GAME_CONVERSATION_TIMEOUT = 300
+
+# factories are imported lazily on first access (PEP 562) to keep startup cheap
+_FACTORIES = {
+    "create_profile_conversation": "telegram_bot.conversations.profile",
+    "create_game_conversation": "telegram_bot.conversations.add_game",
+    "create_custom_game_conversation": "telegram_bot.conversations.add_custom_game",
+    "create_history_conversation": "telegram_bot.conversations.history",
+    "create_pod_conversation": "telegram_bot.conversations.pod",
+    "create_leaderboard_conversation": "telegram_bot.conversations.leaderboard",
+    "create_pod_history_conversation": "telegram_bot.conversations.pod_history",
+    "create_edit_profile_conversation": "telegram_bot.conversations.edit_profile",
+}
 
 __all__ = [
     "create_profile_conversation",
@@ -19,3 +29,14 @@ __all__ = [
     "create_pod_history_conversation",
     "create_edit_profile_conversation",
 ]
+
+
+def __getattr__(name):
+    if name in _FACTORIES:
+        module = importlib.import_module(_FACTORIES[name])
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -9,8 +9,9 @@ from telegram.ext import (
 )
 import logging
 
+from telegram_bot.conversations import GAME_CONVERSATION_TIMEOUT
 from telegram_bot.models.game import GameManager, GameOutcome
-from telegram_bot.models import UnitHandler
+from telegram_bot.models import UnitHandler, AddGameState
 from telegram_bot.strategies import (
     SimpleReplyStrategy,
     LoggingErrorStrategy,
@@ -19,12 +20,17 @@ from telegram_bot.strategies import (
     GameSummaryReply,
     WinnerSelectionReply,
 )
+from telegram_bot.conversations.broadcast import broadcast_game_summary
 
 logger = logging.getLogger(__name__)
 
 # Updated conversation states
 START_GAME, ADD_PLAYERS, SELECT_WINNER, RECORD_ELIMINATIONS, CONFIRM_GAME = range(5)
 
+# plain text replies ("confirm"/"cancel") to the game summary
+_CONFIRM_FILTER = filters.TEXT & ~filters.COMMAND
+_MAX_REPLY_LEN = len("confirm")
+
 
 def create_game_conversation(game_manager: GameManager) -> ConversationHandler:
     """Create a conversation handler for adding a new game."""
@@ -46,7 +52,7 @@ def create_game_conversation(game_manager: GameManager) -> ConversationHandler:
             )
             return ConversationHandler.END
 
-        if context.user_data.get("current_game", None):
+        if context.user_data.get("add_game", None):
             await update.message.reply_text(
                 "You were in the process of adding a game. Removing previous game data before continuing"
             )
@@ -59,9 +65,7 @@ def create_game_conversation(game_manager: GameManager) -> ConversationHandler:
             description = " ".join(context.args)
             game.description = description
         
-        context.user_data["current_game"] = game
-        context.user_data["added_players"] = []
-        context.user_data["eliminated_players"] = []
+        context.user_data["add_game"] = AddGameState(game=game)
         return await PlayerSelectionHandler(update, context)
 
     async def handle_player_selection(
@@ -70,31 +74,30 @@ def create_game_conversation(game_manager: GameManager) -> ConversationHandler:
         """Handle player selection callback."""
         query = update.callback_query
         await query.answer()
+        state = context.user_data["add_game"]
 
         logger.info(query.data)
         if query.data == "reset_players":
-            context.user_data["added_players"] = []
+            state.added_players = []
             return await PlayerSelectionHandler(update, context)
 
         if query.data == "done_adding_players":
-            if len(context.user_data["added_players"]) < 2:
-                await SimpleReplyStrategy(
-                    "❌ Sorry, no playing with yourself. At least 2 players are required for a game."
-                ).execute(update, context)
+            if len(state.added_players) < 2:
+                await TooFewPlayersReply.execute(update, context)
                 return await PlayerSelectionHandler(update, context)
 
-            game = context.user_data["current_game"]
-            for player_id in context.user_data["added_players"]:
-                player = game_manager.get_pod_player(player_id, game.pod_id)
-                game.add_player(player_id, player.name)
+            game = state.game
+            added_players = state.added_players
+            players = game_manager.get_pod_players_bulk(added_players, game.pod_id)
+            for player_id in added_players:
+                game.add_player(player_id, players[player_id].name)
 
-            context.user_data["current_player_id"] = context.user_data["added_players"][
-                0
-            ]
+            state.current_player_idx = 0
+            state.current_player_id = added_players[0]
             return await WinnerSelectionHandler(update, context)
 
-        player_id = int(query.data.split(":")[1])
-        context.user_data["added_players"].append(player_id)
+        player_id = int(query.data.partition(":")[2])
+        state.added_players.append(player_id)
         return await PlayerSelectionHandler(update, context)
 
     async def handle_winner_selection(
@@ -103,17 +106,20 @@ def create_game_conversation(game_manager: GameManager) -> ConversationHandler:
         """Process winner selection and set outcomes"""
         query = update.callback_query
         await query.answer()
+        state = context.user_data["add_game"]
 
-        winner_id = int(query.data.split(":")[-1])
-        game = context.user_data["current_game"]
-        added_players = context.user_data["added_players"]
+        winner_id = int(query.data.rpartition(":")[2])
+        game = state.game
+        added_players = state.added_players
 
         # Set outcomes: winner=WIN, others=LOSE
         for player_id in added_players:
             outcome = GameOutcome.WIN if player_id == winner_id else GameOutcome.LOSE
             game.record_outcome(player_id, outcome)
+        state.winners_count = 1  # exactly one winner is selected
 
-        context.user_data["current_player_id"] = winner_id  # select for winner first
+        state.current_player_idx = added_players.index(winner_id)
+        state.current_player_id = winner_id  # select for winner first
         return await EliminationSelectionHandler(update, context)
 
     async def handle_elimination_selection(
@@ -122,39 +128,30 @@ def create_game_conversation(game_manager: GameManager) -> ConversationHandler:
         """Handle elimination selection callback."""
         query = update.callback_query
         await query.answer()
-
-        game = context.user_data["current_game"]
-        winners = [
-            player_id
-            for player_id, outcome in game.outcomes.items()
-            if outcome == GameOutcome.WIN
-        ]
+        state = context.user_data["add_game"]
+        game, current_player_id = state.game, state.current_player_id
 
         if query.data == "reset_eliminations":
             # remove all eliminations from current player
-            current_player_id = context.user_data["current_player_id"]
-            current_eliminations = [
+            current_eliminations = {
                 player
                 for player, eliminator in game.eliminations.items()
                 if eliminator == current_player_id
-            ]
+            }
             # 1. Remove from game.eliminations
             # 2. Remove from eliminated players
             for player in current_eliminations:
-                game.eliminations.pop(player)
-            context.user_data["eliminated_players"] = [
-                player
-                for player in context.user_data["eliminated_players"]
-                if player not in current_eliminations
-            ]
+                game.eliminations.pop(player, None)
+            state.eliminated_players -= current_eliminations
             return await EliminationSelectionHandler(update, context)
 
         if query.data == "done_eliminations":
             # check if there are still players to eliminate
-            eliminated_players = context.user_data.get("eliminated_players", [])
+            eliminated_players = state.eliminated_players
+            winners_count = state.winners_count
 
             # if eliminated players + winners = total number of players, we are actually done
-            if len(eliminated_players) + len(winners) == len(game.players):
+            if len(eliminated_players) + winners_count == len(game.players):
                 # done
                 try:
                     await query.message.delete()
@@ -164,13 +161,11 @@ def create_game_conversation(game_manager: GameManager) -> ConversationHandler:
                 return await GameSummaryHandler(update, context)
 
             # Move to next player
-            current_idx = context.user_data["added_players"].index(
-                context.user_data["current_player_id"]
-            )
-            if current_idx + 1 < len(context.user_data["added_players"]):
-                context.user_data["current_player_id"] = context.user_data[
-                    "added_players"
-                ][current_idx + 1]
+            added_players = state.added_players
+            next_idx = state.current_player_idx + 1
+            if next_idx < len(added_players):
+                state.current_player_idx = next_idx
+                state.current_player_id = added_players[next_idx]
                 return await EliminationSelectionHandler(update, context)
             else:  # all players iterated through; shouldn't hit this anymore
                 # Delete the message before showing summary
@@ -181,69 +176,48 @@ def create_game_conversation(game_manager: GameManager) -> ConversationHandler:
                     logger.warning(f"Failed to delete message: {str(e)}")
                 return await GameSummaryHandler(update, context)
 
-        eliminated_id = int(query.data.split(":")[1])
-        current_player_id = context.user_data["current_player_id"]
-
+        eliminated_id = int(query.data.partition(":")[2])
         game.eliminations[eliminated_id] = current_player_id
-        context.user_data["eliminated_players"].append(eliminated_id)
+        state.eliminated_players.add(eliminated_id)
         return await EliminationSelectionHandler(update, context)
 
     async def handle_game_confirmation(
         update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> int:
         """Handle game confirmation message."""
-        text = update.message.text.lower()
-        game = context.user_data["current_game"]
+        text = update.message.text
+        # only "confirm"/"cancel" matter, so don't lowercase anything longer
+        text = text.lower() if len(text) <= _MAX_REPLY_LEN else ""
+        game = context.user_data["add_game"].game
 
         if text == "confirm":
             game_manager.add_game(game)
             await update.message.reply_text("👍 Game has been finalized and saved.")
 
-            # Broadcast the game summary to all players
-            for player_id in game.players.keys():
-                try:
-                    outcome = game.outcomes[player_id]
-                    # outcome_emoji = "🏆" if outcome == GameOutcome.WIN else "💀" if outcome == GameOutcome.LOSE else "🤝"
-                    outcome_verb = (
-                        "VICTORIOUS"
-                        if outcome == GameOutcome.WIN
-                        else (
-                            "DEFEATED"
-                            if outcome == GameOutcome.LOSE
-                            else "(what happened?)"
-                        )
-                    )
-                    player_personal_message = (
-                        f"📢 You were {outcome_verb} in a recent match!"
-                    )
-
-                    await context.bot.send_message(
-                        chat_id=player_id,
-                        parse_mode="HTML",
-                        text=f"{player_personal_message}\n\n{str(game)}",
-                    )
-                except Exception as e:
-                    # Log error but continue with other players if one fails
-                    print(
-                        f"Failed to send game summary to player {player_id}: {str(e)}"
-                    )
-                    logger.warning(
-                        f"Failed to send game summary to player {player_id}: {str(e)}"
-                    )
+            # Broadcast the game summary to all players in the background so the
+            # confirmation isn't held up by the slowest DM
+            context.application.create_task(
+                broadcast_game_summary(context.bot, game, game_manager), update=update
+            )
             # cleanup
             _reset_user_data(context)
             return ConversationHandler.END
         elif text == "cancel":
             _reset_user_data(context)
-            await SimpleReplyStrategy("❌ Game has been discarded.").execute(
-                update, context
-            )
+            await GameDiscardedReply.execute(update, context)
             return ConversationHandler.END
         else:
             # wait for user to reply with "confirm" or "cancel"
             return CONFIRM_GAME
 
     # Create handlers with strategies
+    # Handlers and strategies are built once per conversation and shared by every
+    # callback; none of them hold per-update state
+    TooFewPlayersReply = SimpleReplyStrategy(
+        "❌ Sorry, no playing with yourself. At least 2 players are required for a game."
+    )
+    GameDiscardedReply = SimpleReplyStrategy("❌ Game has been discarded.")
+
     PlayerSelectionHandler = UnitHandler(
         reply_strategy=PlayerSelectionReply(game_manager),
         error_strategy=LoggingErrorStrategy(notify_user=True),
@@ -278,14 +252,7 @@ def create_game_conversation(game_manager: GameManager) -> ConversationHandler:
         return ConversationHandler.END
 
     def _reset_user_data(context: ContextTypes.DEFAULT_TYPE) -> None:
-        if "current_game" in context.user_data:
-            del context.user_data["current_game"]
-        if "added_players" in context.user_data:
-            del context.user_data["added_players"]
-        if "eliminated_players" in context.user_data:
-            del context.user_data["eliminated_players"]
-        if "current_player_id" in context.user_data:
-            del context.user_data["current_player_id"]
+        context.user_data.pop("add_game", None)
 
     return ConversationHandler(
         entry_points=[CommandHandler("game", start_game)],
@@ -294,12 +261,12 @@ def create_game_conversation(game_manager: GameManager) -> ConversationHandler:
             SELECT_WINNER: [CallbackQueryHandler(handle_winner_selection)],
             RECORD_ELIMINATIONS: [CallbackQueryHandler(handle_elimination_selection)],
             CONFIRM_GAME: [
-                MessageHandler(
-                    filters.TEXT & ~filters.COMMAND, handle_game_confirmation
-                )
+                MessageHandler(_CONFIRM_FILTER, handle_game_confirmation)
             ],
         },
         fallbacks=[CommandHandler("cancel", cancel_command)],
-        conversation_timeout=300,  # Timeout after 5 minutes of inactivity
+        conversation_timeout=GAME_CONVERSATION_TIMEOUT,
+        name="game_conversation",
+        persistent=True,
         per_user=True,
     )
@@ -0,0 +1,43 @@
+"""Broadcast finalized game summaries to the players involved."""
+
+import logging
+
+from telegram_bot.models.game import Game, GameManager, GameOutcome
+from telegram_bot.utils import safe_send_many
+
+logger = logging.getLogger(__name__)
+
+_OUTCOME_VERBS = {
+    GameOutcome.WIN: "VICTORIOUS",
+    GameOutcome.LOSE: "DEFEATED",
+}
+_DEFAULT_OUTCOME_VERB = "(what happened?)"
+
+# per-outcome message headers are built once at import rather than per recipient
+_OUTCOME_HEADERS = {
+    outcome: f"📢 You were {_OUTCOME_VERBS.get(outcome, _DEFAULT_OUTCOME_VERB)} in a recent match!"
+    for outcome in GameOutcome
+}
+
+
+async def broadcast_game_summary(bot, game: Game, game_manager: GameManager) -> None:
+    """DM every player in the game their outcome along with the game summary.
+
+    Sends go out concurrently but are spaced out and retried on RetryAfter, so a
+    busy pod gets delayed messages rather than dropped ones. A failure for one
+    player is logged and does not affect the others. Players the bot can't DM
+    are remembered and skipped in later broadcasts.
+    """
+    # every recipient with the same outcome gets the same text, so build each once
+    summary_suffix = "\n\n" + str(game)
+    texts = {
+        outcome: header + summary_suffix for outcome, header in _OUTCOME_HEADERS.items()
+    }
+
+    await safe_send_many(
+        bot,
+        ((player_id, texts[outcome]) for player_id, outcome in game.outcomes.items()),
+        parse_mode="HTML",
+        blocked_users=game_manager.blocked_users,
+        on_unreachable=game_manager.mark_user_blocked,
+    )
@@ -10,9 +10,11 @@ from telegram.ext import (
     CommandHandler,
     MessageHandler,
     CallbackQueryHandler,
+    TypeHandler,
     filters,
     ContextTypes,
 )
+from telegram_bot.conversations import CONVERSATION_TIMEOUT
 from telegram_bot.models.game import GameManager
 from telegram_bot.models import UnitHandler
 from telegram_bot.strategies import (
@@ -23,11 +25,6 @@ from telegram_bot.strategies import (
 from telegram_bot.utils import save_avatar
 import logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 # Add these states at the top with other state definitions
@@ -37,6 +34,37 @@ CHOOSE_ACTION = "choose_action"
 ENTER_NEW_NAME = "enter_new_name"
 ENTER_NEW_PHOTO = "enter_new_photo"
 
+# user_data keys owned by this conversation; other conversations' state is left alone
+_RESET_KEYS = ("pod_id", "edit_mode", "new_name", "new_avatar")
+
+# static keyboards, built once
+_GROUP_EDIT_KEYBOARD = InlineKeyboardMarkup(
+    [
+        [InlineKeyboardButton("Change Name", callback_data="name")],
+        [InlineKeyboardButton("Change Avatar", callback_data="avatar")],
+        [InlineKeyboardButton("Cancel", callback_data="cancel")],
+    ]
+)
+_EDIT_OPTIONS_KEYBOARD = InlineKeyboardMarkup(
+    [
+        [InlineKeyboardButton("Change Name", callback_data="name")],
+        [InlineKeyboardButton("Change Avatar", callback_data="avatar")],
+        [InlineKeyboardButton("Both", callback_data="both")],
+        [InlineKeyboardButton("Cancel", callback_data="cancel")],
+    ]
+)
+
+_UPDATE_SUCCEEDED_REPLY = SimpleReplyStrategy("✅ Profile updated successfully!")
+_UPDATE_FAILED_REPLY = SimpleReplyStrategy(
+    "❌ Failed to update profile. Please try again."
+)
+
+
+def _reset_user_data(context: ContextTypes.DEFAULT_TYPE) -> None:
+    user_data = context.user_data
+    for key in _RESET_KEYS:
+        user_data.pop(key, None)
+
 
 def create_edit_profile_conversation(game_manager: GameManager) -> ConversationHandler:
     async def start_edit_profile(
@@ -47,7 +75,7 @@ def create_edit_profile_conversation(game_manager: GameManager) -> ConversationH
         user_id = update.effective_user.id
 
         # Reset any previous data
-        context.user_data.clear()
+        _reset_user_data(context)
 
         if chat_type in ["group", "supergroup"]:
             # Handle group chat context
@@ -69,13 +97,7 @@ def create_edit_profile_conversation(game_manager: GameManager) -> ConversationH
             await context.bot.send_message(
                 chat_id=user_id,
                 text=f"✏️ Editing profile for {game_manager.pods[pod_id].name}...",
-                reply_markup=InlineKeyboardMarkup(
-                    [
-                        [InlineKeyboardButton("Change Name", callback_data="name")],
-                        [InlineKeyboardButton("Change Avatar", callback_data="avatar")],
-                        [InlineKeyboardButton("Cancel", callback_data="cancel")],
-                    ]
-                ),
+                reply_markup=_GROUP_EDIT_KEYBOARD,
             )
             return CHOOSE_ACTION
 
@@ -88,16 +110,18 @@ def create_edit_profile_conversation(game_manager: GameManager) -> ConversationH
                 return ConversationHandler.END
 
             if len(pods) == 1:
-                context.user_data["pod_id"] = pods[0].pod_id
+                context.user_data["pod_id"] = pods[0].id
                 return await present_edit_options(update, context)
 
-            buttons = [
-                [InlineKeyboardButton(pod.name, callback_data=f"pod_{pod.pod_id}")]
-                for pod in pods
-            ]
-            await SimpleReplyStrategy(
-                "📂 Which pod's profile would you like to edit?"
-            ).execute(update, context, reply_markup=InlineKeyboardMarkup(buttons))
+            await update.message.reply_text(
+                "📂 Which pod's profile would you like to edit?",
+                reply_markup=InlineKeyboardMarkup.from_column(
+                    [
+                        InlineKeyboardButton(pod.name, callback_data=f"pod_{pod.id}")
+                        for pod in pods
+                    ]
+                ),
+            )
             return SELECT_POD
 
     async def select_pod(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
@@ -113,14 +137,7 @@ def create_edit_profile_conversation(game_manager: GameManager) -> ConversationH
         update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> int:
         """Present edit options after pod selection."""
-        keyboard = InlineKeyboardMarkup(
-            [
-                [InlineKeyboardButton("Change Name", callback_data="name")],
-                [InlineKeyboardButton("Change Avatar", callback_data="avatar")],
-                [InlineKeyboardButton("Both", callback_data="both")],
-                [InlineKeyboardButton("Cancel", callback_data="cancel")],
-            ]
-        )
+        keyboard = _EDIT_OPTIONS_KEYBOARD
 
         if isinstance(update, CallbackQuery):
             await update.edit_message_text("📝 What would you like to update?")
@@ -181,8 +198,8 @@ def create_edit_profile_conversation(game_manager: GameManager) -> ConversationH
         try:
             avatar_path = await save_avatar(context.bot, photo, user_id, pod_id)
             context.user_data["new_avatar"] = avatar_path
-        except Exception as e:
-            logger.error(f"Failed to save avatar: {str(e)}")
+        except Exception:
+            logger.exception("Failed to save avatar")
             await SimpleReplyStrategy(
                 "❌ Failed to save photo. Please try again."
             ).execute(update, context)
@@ -200,32 +217,28 @@ def create_edit_profile_conversation(game_manager: GameManager) -> ConversationH
         new_avatar = context.user_data.get("new_avatar")
 
         try:
-            # Update database
-            session = game_manager.Session()
-            player = (
-                session.query(PodPlayer)
-                .filter_by(telegram_id=user_id, pod_id=pod_id)
-                .first()
+            # Update database; False means no matching profile or nothing to change
+            updated = game_manager.update_player_profile(
+                user_id, pod_id, name=new_name, avatar_url=new_avatar
             )
+        except Exception:
+            logger.exception("Update failed")
+            updated = False
+        finally:
+            _reset_user_data(context)
 
-            if new_name:
-                player.name = new_name
-            if new_avatar:
-                player.avatar_url = new_avatar
+        if updated:
+            await _UPDATE_SUCCEEDED_REPLY.execute(update, context)
+        else:
+            await _UPDATE_FAILED_REPLY.execute(update, context)
 
-            session.commit()
-            await SimpleReplyStrategy("✅ Profile updated successfully!").execute(
-                update, context
-            )
-        except Exception as e:
-            logger.error(f"Update failed: {str(e)}")
-            await SimpleReplyStrategy(
-                "❌ Failed to update profile. Please try again."
-            ).execute(update, context)
-        finally:
-            session.close()
-            context.user_data.clear()
+        return ConversationHandler.END
 
+    async def handle_timeout(
+        update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> int:
+        """Drop any pending edits when the user goes quiet."""
+        _reset_user_data(context)
         return ConversationHandler.END
 
     return ConversationHandler(
@@ -237,11 +250,15 @@ def create_edit_profile_conversation(game_manager: GameManager) -> ConversationH
                 MessageHandler(filters.TEXT & ~filters.COMMAND, handle_new_name)
             ],
             ENTER_NEW_PHOTO: [MessageHandler(filters.PHOTO, handle_new_photo)],
+            ConversationHandler.TIMEOUT: [TypeHandler(Update, handle_timeout)],
         },
         fallbacks=[
             CommandHandler("cancel", lambda u, c: ConversationHandler.END),
             MessageHandler(filters.ALL, lambda u, c: None),  # Ignore invalid inputs
         ],
+        name="edit_profile_conversation",
+        persistent=True,
         per_user=True,
         per_chat=True,
+        conversation_timeout=CONVERSATION_TIMEOUT,
     )
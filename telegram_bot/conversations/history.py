@@ -6,6 +6,7 @@ from telegram.ext import (
     CallbackQueryHandler,
 )
 
+from telegram_bot.conversations import CONVERSATION_TIMEOUT
 from telegram_bot.models.game import GameManager
 from telegram_bot.models import UnitHandler
 
@@ -48,4 +49,5 @@ def create_history_conversation(game_manager: GameManager):
         per_chat=True,
         per_user=True,
         allow_reentry=True,
+        conversation_timeout=CONVERSATION_TIMEOUT,
     )
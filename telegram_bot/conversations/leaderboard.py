@@ -1,5 +1,6 @@
 """Leaderboard conversation handlers."""
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, InputMediaPhoto
+from telegram.constants import MessageLimit
 from telegram.ext import (
     ConversationHandler,
     CommandHandler,
@@ -8,23 +9,147 @@ from telegram.ext import (
 )
 from telegram.error import BadRequest
 
+from telegram_bot.conversations import CONVERSATION_TIMEOUT
 from telegram_bot.models.game import GameManager
 from telegram_bot.strategies import SimpleReplyStrategy
 from telegram_bot.stats.leaderboard import (
     get_player_stats,
     generate_leaderboard_text,
     generate_stat_cards,
-    generate_leaderboard_image,
+    render_leaderboard_image,
     TIME_FILTERS,
     SORT_TITLES
 )
 
+import hashlib
 import logging
+import time
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Rendered text per (pod, sort, time filter, pod version), and PNG bytes per
+# (pod, time filter, pod version) since the highlight cards don't depend on the
+# sort order. The pod version changes on every write, and entries also expire so
+# the rolling "past week" window doesn't go stale.
+RENDER_CACHE_TTL = 300  # seconds
+_render_cache: Dict[Tuple[int, str, str, int], Tuple[float, str]] = {}
+_image_cache: Dict[Tuple[int, str, int], Tuple[float, Optional[bytes]]] = {}
+
+
+def _build_keyboard(sort_by: str, time_filter: str) -> InlineKeyboardMarkup:
+    """Create buttons for time filter and sorting, marking the current selection."""
+    keyboard = []
+    # Time filter row
+    time_buttons = []
+    for tf in TIME_FILTERS:
+        text = f"{TIME_FILTERS[tf]}" + (" ✓" if tf == time_filter else "")
+        time_buttons.append(
+            InlineKeyboardButton(
+                text=text, callback_data=f"leaderboard_time_{tf}_{sort_by}"
+            )
+        )
+    keyboard.append(time_buttons)
+
+    # Sort method row
+    sort_buttons = []
+    for sm in SORT_TITLES:
+        text = f"{SORT_TITLES[sm]}" + (" ✓" if sm == sort_by else "")
+        sort_buttons.append(
+            InlineKeyboardButton(
+                text=text, callback_data=f"leaderboard_sort_{sm}_{time_filter}"
+            )
+        )
+    keyboard.append(sort_buttons)
+
+    return InlineKeyboardMarkup(keyboard)
+
+
+# every (sort, time filter) combination is known up front, so build them all once
+_KEYBOARDS = {
+    (sort_by, time_filter): _build_keyboard(sort_by, time_filter)
+    for sort_by in SORT_TITLES
+    for time_filter in TIME_FILTERS
+}
+
+# callback data -> (sort, time filter) it selects, for every button on those keyboards
+_CALLBACKS: Dict[str, Tuple[str, str]] = {
+    f"leaderboard_{kind}": selection
+    for sort_by, time_filter in _KEYBOARDS
+    for kind, selection in (
+        (f"time_{time_filter}_{sort_by}", (sort_by, time_filter)),
+        (f"sort_{sort_by}_{time_filter}", (sort_by, time_filter)),
+    )
+}
+
+
+# returned by _cache_get on a miss, since a cached image may itself be None
+_MISS = object()
+
+
+def _cache_get(cache: dict, key):
+    cached = cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    return _MISS
+
+
+def _cache_put(cache: dict, key, value) -> None:
+    now = time.monotonic()
+    # drop expired entries so the cache stays bounded by active pods
+    for stale_key in [k for k, v in cache.items() if v[0] <= now]:
+        del cache[stale_key]
+    cache[key] = (now + RENDER_CACHE_TTL, value)
+
+
+def _render_digest(message: str, image_bytes: Optional[bytes]) -> Tuple[str, str]:
+    """Digests of the leaderboard text and image, to tell which of them changed."""
+    return (
+        hashlib.blake2b(message.encode(), digest_size=16).hexdigest(),
+        hashlib.blake2b(image_bytes or b"", digest_size=16).hexdigest(),
+    )
+
+
+def _fits_caption(message: str, image_bytes: Optional[bytes]) -> bool:
+    """Whether the leaderboard can be sent as one photo with the text as its caption."""
+    return bool(image_bytes) and len(message) <= MessageLimit.CAPTION_LENGTH
+
 
 def create_leaderboard_conversation(game_manager: GameManager) -> ConversationHandler:
+    async def render_leaderboard(
+        chat_id: int, pod, sort_by: str, time_filter: str
+    ) -> Tuple[str, Optional[bytes]]:
+        """Return the leaderboard text and image, reusing cached renders if possible."""
+        version = game_manager.pod_version(chat_id)
+        text_key = (chat_id, sort_by, time_filter, version)
+        image_key = (chat_id, time_filter, version)
+        message = _cache_get(_render_cache, text_key)
+        image_bytes = _cache_get(_image_cache, image_key)
+        if message is not _MISS and image_bytes is not _MISS:
+            return message, image_bytes
+
+        # Get player stats
+        active_players, inactive_players = get_player_stats(
+            game_manager, chat_id, time_filter, sort_by
+        )
+
+        if message is _MISS:
+            # Generate text leaderboard
+            message = generate_leaderboard_text(
+                pod.name, active_players, inactive_players, sort_by, time_filter
+            )
+            _cache_put(_render_cache, text_key, message)
+
+        if image_bytes is _MISS:
+            # Generate stat cards and image
+            stat_cards = generate_stat_cards(active_players, game_manager, chat_id)
+            image_bytes = await render_leaderboard_image(
+                stat_cards, pod.name, time_filter
+            )
+            _cache_put(_image_cache, image_key, image_bytes)
+
+        return message, image_bytes
+
     async def show_leaderboard(
         update: Update, context: ContextTypes.DEFAULT_TYPE, sort_by="winrate", time_filter="week"
     ) -> None:
@@ -39,59 +164,39 @@ def create_leaderboard_conversation(game_manager: GameManager) -> ConversationHa
             )
             return
 
-        # Get player stats
-        active_players, inactive_players = get_player_stats(
-            game_manager, chat_id, time_filter, sort_by
+        message, image_bytes = await render_leaderboard(
+            chat_id, pod, sort_by, time_filter
         )
+        reply_markup = _KEYBOARDS[(sort_by, time_filter)]
 
-        # Generate and send text leaderboard
-        message = generate_leaderboard_text(
-            pod.name, active_players, inactive_players, sort_by, time_filter
-        )
-        
-        # Create buttons for time filter and sorting
-        keyboard = []
-        # Time filter row
-        time_buttons = []
-        for tf in TIME_FILTERS:
-            text = f"{TIME_FILTERS[tf]}" + (" ✓" if tf == time_filter else "")
-            time_buttons.append(
-                InlineKeyboardButton(
-                    text=text, callback_data=f"leaderboard_time_{tf}_{sort_by}"
-                )
-            )
-        keyboard.append(time_buttons)
-
-        # Sort method row
-        sort_buttons = []
-        for sm in SORT_TITLES:
-            text = f"{SORT_TITLES[sm]}" + (" ✓" if sm == sort_by else "")
-            sort_buttons.append(
-                InlineKeyboardButton(
-                    text=text, callback_data=f"leaderboard_sort_{sm}_{time_filter}"
+        try:
+            # a single photo with the leaderboard as its caption can later be
+            # edited in place; otherwise fall back to a photo plus a text message
+            if _fits_caption(message, image_bytes):
+                sent = await context.bot.send_photo(
+                    chat_id=chat_id,
+                    photo=image_bytes,
+                    caption=message,
+                    reply_markup=reply_markup,
+                    parse_mode="HTML",
                 )
-            )
-        keyboard.append(sort_buttons)
-
-        reply_markup = InlineKeyboardMarkup(keyboard)
+            else:
+                if image_bytes:
+                    await context.bot.send_photo(chat_id=chat_id, photo=image_bytes)
 
-        try:
-            # Generate stat cards and image
-            stat_cards = generate_stat_cards(active_players, game_manager, chat_id)
-            if stat_cards:
-                image_bio = generate_leaderboard_image(stat_cards, pod.name, time_filter)
-                if image_bio:
-                    await context.bot.send_photo(chat_id=chat_id, photo=image_bio)
-
-            await context.bot.send_message(
-                chat_id=chat_id,
-                text=message,
-                reply_markup=reply_markup,
-                parse_mode="HTML",
+                sent = await context.bot.send_message(
+                    chat_id=chat_id,
+                    text=message,
+                    reply_markup=reply_markup,
+                    parse_mode="HTML",
+                )
+            context.chat_data["leaderboard_digest"] = (
+                sent.message_id,
+                *_render_digest(message, image_bytes),
             )
 
         except BadRequest as e:
-            logger.error(f"Error sending leaderboard: {e}")
+            logger.error("Error sending leaderboard: %s", e)
             await SimpleReplyStrategy().handle_error(update, context, e)
 
     async def leaderboard_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -102,12 +207,54 @@ def create_leaderboard_conversation(game_manager: GameManager) -> ConversationHa
         query = update.callback_query
         await query.answer()
 
-        # Parse the callback data
-        _, action, value, other = query.data.split("_")
-        if action == "time":
-            time_filter, sort_by = value, other
-        else:  # action == "sort"
-            sort_by, time_filter = value, other
+        # Look up the selection; anything else is a stale or malformed button
+        selection = _CALLBACKS.get(query.data)
+        if selection is None:
+            logger.warning("Unknown leaderboard callback data: %r", query.data)
+            return
+        sort_by, time_filter = selection
+
+        chat_id = update.effective_chat.id
+        pod = game_manager.pods.get(chat_id)
+        if pod:
+            message, image_bytes = await render_leaderboard(
+                chat_id, pod, sort_by, time_filter
+            )
+            reply_markup = _KEYBOARDS[(sort_by, time_filter)]
+            digest = (query.message.message_id, *_render_digest(message, image_bytes))
+            shown = context.chat_data.get("leaderboard_digest")
+
+            # Nothing changed (e.g. the already-selected button was pressed)
+            if shown == digest:
+                return
+
+            # Update the pressed message in place when its kind matches the new render
+            try:
+                if query.message.photo and _fits_caption(message, image_bytes):
+                    if shown and shown[0::2] == digest[0::2]:
+                        # same image (e.g. only the sort changed); just swap the text
+                        await query.edit_message_caption(
+                            caption=message,
+                            reply_markup=reply_markup,
+                            parse_mode="HTML",
+                        )
+                    else:
+                        await query.edit_message_media(
+                            media=InputMediaPhoto(
+                                image_bytes, caption=message, parse_mode="HTML"
+                            ),
+                            reply_markup=reply_markup,
+                        )
+                    context.chat_data["leaderboard_digest"] = digest
+                    return
+                if not query.message.photo and not image_bytes:
+                    await query.edit_message_text(
+                        message, reply_markup=reply_markup, parse_mode="HTML"
+                    )
+                    context.chat_data["leaderboard_digest"] = digest
+                    return
+            except BadRequest as e:
+                logger.warning("Could not edit leaderboard in place: %s", e)
 
         # Show the updated leaderboard
         await show_leaderboard(update, context, sort_by, time_filter)
@@ -123,4 +270,5 @@ def create_leaderboard_conversation(game_manager: GameManager) -> ConversationHa
         states={},
         fallbacks=[],
         per_message=False,
+        conversation_timeout=CONVERSATION_TIMEOUT,
     ), CallbackQueryHandler(button_callback, pattern=r"^leaderboard_")
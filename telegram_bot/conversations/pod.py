@@ -1,4 +1,8 @@
+import time
+from operator import attrgetter
+
 from telegram import Update
+from telegram.error import TelegramError
 from telegram.ext import (
     ConversationHandler,
     CommandHandler,
@@ -7,12 +11,16 @@ from telegram.ext import (
     ContextTypes,
 )
 
+from telegram_bot.conversations import CONVERSATION_TIMEOUT
 from telegram_bot.models.game import GameManager
 
 from telegram_bot.strategies import SimpleReplyStrategy, LoggingErrorStrategy
 
 NAMING_POD = 0
 
+# membership changes slowly, so the group's member count is reused for a while
+MEMBER_COUNT_TTL = 300  # seconds
+
 
 def create_pod_conversation(game_manager: GameManager) -> ConversationHandler:
     async def start_pod_creation(
@@ -30,66 +38,54 @@ def create_pod_conversation(game_manager: GameManager) -> ConversationHandler:
 
             pod = game_manager.pods[chat_id]
 
-            # Get all members in the pod
-            member_stats = []
-            for user_id in game_manager.get_pod_members(chat_id):
-                if stats := game_manager.get_player_stats(user_id, chat_id):
-                    member_stats.append(stats)
+            # Get stats for all members in the pod in one go
+            member_stats = game_manager.get_pod_stats_bulk(chat_id)
 
             # Sort members by win rate
-            member_stats.sort(
-                key=lambda x: x.wins / x.games_played if x.games_played > 0 else 0,
-                reverse=True,
-            )
+            member_stats.sort(key=attrgetter("winrate"), reverse=True)
 
-            # Get all chat members who haven't signed up
+            # Get all chat members who haven't signed up. Wall-clock time rather than
+            # monotonic, since chat_data is persisted across restarts
+            now = time.time()
+            cached = context.chat_data.get("member_count")
             try:
-                chat_members = await update.effective_chat.get_member_count()
-                signed_up = len(pod.members)
-                not_signed_up = chat_members - signed_up - 1  # -1 for the bot itself
-
-                message = (
-                    f"<b>📊 Pod Status: {pod.name}</b>\n\n"
-                    f"<b>👥 Members ({signed_up}/{chat_members - 1})</b>\n"
-                )
-
-                for i, stats in enumerate(member_stats, 1):
-                    winrate = (
-                        stats.wins / stats.games_played * 100
-                        if stats.games_played > 0
-                        else 0
-                    )
-                    message += (
-                        f"{i}. <b>{stats.name}</b>\n"
-                        f"   • Win Rate: <code>{winrate:.1f}%</code>\n"
-                        f"   • Record: <code>{stats.wins}W-{stats.losses}L</code>\n"
-                        f"   • Games: <code>{stats.games_played}</code>\n\n"
-                    )
-
-                if not_signed_up > 0:
-                    message += (
-                        f"\n<i>😴 {not_signed_up} members haven't signed up yet.</i>\n"
-                        "<i>They can join using /profile</i>"
-                    )
-
-                await SimpleReplyStrategy(message_template=message, parse_mode="HTML").execute(update, context)
-            except Exception as e:
+                if cached and 0 <= now - cached[1] < MEMBER_COUNT_TTL:
+                    chat_members = cached[0]
+                else:
+                    chat_members = await update.effective_chat.get_member_count()
+                    context.chat_data["member_count"] = (chat_members, now)
+            except TelegramError:
                 # Fallback to basic message if we can't get member count
                 await SimpleReplyStrategy(
                     f"This group chat's pod, {pod.name}, has already been created. Use /profile to add yourself to this pod."
                 ).execute(update, context)
-            return ConversationHandler.END
+                return ConversationHandler.END
+
+            signed_up = len(pod.members)
+            not_signed_up = chat_members - signed_up - 1  # -1 for the bot itself
+
+            parts = [
+                f"<b>📊 Pod Status: {pod.name}</b>\n\n"
+                f"<b>👥 Members ({signed_up}/{chat_members - 1})</b>\n"
+            ]
+
+            for i, stats in enumerate(member_stats, 1):
+                winrate = stats.winrate * 100
+                parts.append(
+                    f"{i}. <b>{stats.name}</b>\n"
+                    f"   • Win Rate: <code>{winrate:.1f}%</code>\n"
+                    f"   • Record: <code>{stats.wins}W-{stats.losses}L</code>\n"
+                    f"   • Games: <code>{stats.games_played}</code>\n\n"
+                )
 
-        chat_id = update.effective_chat.id
+            if not_signed_up > 0:
+                parts.append(
+                    f"\n<i>😴 {not_signed_up} members haven't signed up yet.</i>\n"
+                    "<i>They can join using /profile</i>"
+                )
+            message = "".join(parts)
 
-        if chat_id in game_manager.pods:
-            pod = game_manager.pods[chat_id]
-            await SimpleReplyStrategy(
-                message_template=(
-                    f"This group chat's pod, {pod.name}, has already been created. Use /profile to add yourself to this pod."
-                ),
-                parse_mode="HTML",
-            ).execute(update, context)
+            await SimpleReplyStrategy(message_template=message, parse_mode="HTML").execute(update, context)
             return ConversationHandler.END
 
         await SimpleReplyStrategy(
@@ -108,9 +104,7 @@ def create_pod_conversation(game_manager: GameManager) -> ConversationHandler:
         try:
             pod = game_manager.create_pod(chat_id, pod_name)
             await update.message.reply_text(
-                f"Pod '{pod_name}' has been created successfully!"
-            )
-            await update.message.reply_text(
+                f"Pod '{pod_name}' has been created successfully!\n\n"
                 "After pod members have created their profiles with /profile use /game to start recording games for this pod."
             )
         except ValueError as e:
@@ -135,8 +129,9 @@ def create_pod_conversation(game_manager: GameManager) -> ConversationHandler:
         },
         fallbacks=[CommandHandler("cancel", cancel)],
         name="pod_conversation",
-        persistent=False,
+        persistent=True,
         allow_reentry=True,
         per_chat=True,
         per_user=False,
+        conversation_timeout=CONVERSATION_TIMEOUT,
     )
@@ -8,6 +8,7 @@ from telegram.ext import (
     CallbackQueryHandler,
 )
 
+from telegram_bot.conversations import CONVERSATION_TIMEOUT
 from telegram_bot.models.game import GameManager
 from telegram_bot.models import UnitHandler
 from telegram_bot.strategies import LoggingErrorStrategy
@@ -42,4 +43,5 @@ def create_pod_history_conversation(game_manager: GameManager) -> ConversationHa
         },
         fallbacks=[],
         per_message=False,
+        conversation_timeout=CONVERSATION_TIMEOUT,
     )
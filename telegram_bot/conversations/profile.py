@@ -10,9 +10,11 @@ from telegram.ext import (
     ConversationHandler,
     CommandHandler,
     MessageHandler,
+    TypeHandler,
     filters,
     ContextTypes,
 )
+from telegram_bot.conversations import CONVERSATION_TIMEOUT
 from telegram_bot.models.game import GameManager
 from telegram_bot.models import UnitHandler
 
@@ -24,16 +26,22 @@ from telegram_bot.strategies import (
 from telegram_bot.utils import save_avatar
 import logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 ENTER_NAME = 0
 ENTER_PHOTO = 1
 
+# filters are combined once at import rather than on every factory call
+_NAME_FILTER = filters.TEXT & ~filters.COMMAND
+_UNEXPECTED_FILTER = ~filters.COMMAND & ~filters.PHOTO
+
+# filled with (pod name, user's first name)
+_CREATE_PROFILE_TEMPLATE = (
+    "👋 Let's create your player profile! What shall others in %s know you as, %s?"
+    "\n---\n"
+    "<i>Reply to this by tapping this message and clicking 'Reply'. I can't see messages that aren't replies to me!</i>"
+)
+
 
 def create_profile_conversation(game_manager: GameManager) -> ConversationHandler:
     # profile handler has 2 routes:
@@ -47,11 +55,7 @@ def create_profile_conversation(game_manager: GameManager) -> ConversationHandle
             update.effective_user.first_name if update.effective_user else "User"
         )
         pod = game_manager.pods.get(update.effective_chat.id)
-        return (
-            f"👋 Let's create your player profile! What shall others in {pod.name} know you as, {user_name}?"
-            "\n---\n"
-            "<i>Reply to this by tapping this message and clicking 'Reply'. I can't see messages that aren't replies to me!</i>"
-        )
+        return _CREATE_PROFILE_TEMPLATE % (pod.name, user_name)
 
     CreateProfileHandler = UnitHandler(
         reply_strategy=SimpleReplyStrategy(
@@ -71,13 +75,13 @@ def create_profile_conversation(game_manager: GameManager) -> ConversationHandle
     async def load_profile_and_route_user(
         update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> str:
-        # retrieve the player profile from the game manager via their telegram id:
-        player = game_manager.get_player(telegram_id=update.effective_user.id)
+        user_id = update.effective_user.id
 
         # check if in a group chat
         if update.effective_chat.type not in ["group", "supergroup"]:
-            # if not in a group chat, check if player already exists:
-            if player:
+            # if not in a group chat, check if player already exists; memberships
+            # are cached by the game manager, so this doesn't compute any stats
+            if game_manager.get_user_pods(user_id):
                 return await StatsHandler(update, context)
             else:
                 # if player doesn't exist, tell them to create a profile via a pod
@@ -88,18 +92,15 @@ def create_profile_conversation(game_manager: GameManager) -> ConversationHandle
 
         chat_id = update.effective_chat.id
 
-        if chat_id not in game_manager.pods:
+        pod = game_manager.pods.get(chat_id)
+        if pod is None:
             await SimpleReplyStrategy(
                 message_template="❌ No pod exists for this group. Create one first using /pod"
             ).execute(update, context)
             return ConversationHandler.END
 
-        # attempt to retrieve the player's stats from the pod
-        player_stats = game_manager.get_player_stats(
-            telegram_id=update.effective_user.id, pod_id=chat_id
-        )
-        # chain subsequent handlers based on whether the player exists or not
-        if player_stats:
+        # chain subsequent handlers based on whether the player is in the pod or not
+        if user_id in pod.members:
             return await StatsHandler(update, context)
         else:
             return await CreateProfileHandler(update, context)
@@ -120,7 +121,9 @@ def create_profile_conversation(game_manager: GameManager) -> ConversationHandle
         update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> str:
         chat_id = update.effective_chat.id
-        name = context.user_data["profile_name"]
+        # the name is only dropped once the profile exists, so a failed download
+        # or insert leaves the user able to resend their photo
+        name = context.user_data.get("profile_name")
 
         if not name:
             logger.error(
@@ -151,6 +154,7 @@ def create_profile_conversation(game_manager: GameManager) -> ConversationHandle
             pod_id=chat_id,
             avatar_url=avatar_path,
         )
+        context.user_data.pop("profile_name", None)
 
         await update.message.reply_text(
             f"✨ Welcome, {name}! Your profile has been created with your photo. You can now participate in games!"
@@ -161,7 +165,7 @@ def create_profile_conversation(game_manager: GameManager) -> ConversationHandle
         update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> str:
         chat_id = update.effective_chat.id
-        name = context.user_data["profile_name"]
+        name = context.user_data.get("profile_name")
 
         if not name:
             logger.error(
@@ -197,10 +201,13 @@ def create_profile_conversation(game_manager: GameManager) -> ConversationHandle
             )
         except Exception as e:
             logger.exception("Failed to create player profile without a custom photo.")
+            # the conversation ends here, so don't leave the name behind
+            context.user_data.pop("profile_name", None)
             await update.message.reply_text(
                 "❌ Something went wrong while creating your profile. Please try again."
             )
             return ConversationHandler.END
+        context.user_data.pop("profile_name", None)
 
         await update.message.reply_text(
             f"✨ Welcome, {name}! Your profile has been created. You can now participate in games!"
@@ -217,29 +224,29 @@ def create_profile_conversation(game_manager: GameManager) -> ConversationHandle
         )
         return ENTER_PHOTO
 
-    def _reset_user_data(context):
-        # remove name and photo
-        if "profile_name" in context.user_data:
-            del context.user_data["profile_name"]
-
     async def cancel_profile_creation(
         update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Cancel profile creation process."""
         logger.info("Profile creation conversation canceled by user.")
-        _reset_user_data(context)
+        context.user_data.pop("profile_name", None)
         await update.message.reply_text(
             "❌ Profile creation cancelled. Use /profile to try again."
         )
         return ConversationHandler.END
 
+    async def handle_timeout(
+        update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> int:
+        """Drop the half-entered profile when the user goes quiet."""
+        context.user_data.pop("profile_name", None)
+        return ConversationHandler.END
+
     return ConversationHandler(
         entry_points=[CommandHandler("profile", load_profile_and_route_user)],
         states={
             ENTER_NAME: [
-                MessageHandler(
-                    filters.TEXT & ~filters.COMMAND, receive_name_and_prompt_photo
-                ),
+                MessageHandler(_NAME_FILTER, receive_name_and_prompt_photo),
                 CommandHandler(
                     "profile", cancel_profile_creation
                 ),  # Cancel if user hits /profile again
@@ -247,15 +254,17 @@ def create_profile_conversation(game_manager: GameManager) -> ConversationHandle
             ENTER_PHOTO: [
                 MessageHandler(filters.PHOTO, receive_photo_and_create_profile),
                 CommandHandler("skip", skip_photo_and_create_profile),
-                MessageHandler(
-                    ~filters.COMMAND & ~filters.PHOTO, handle_unexpected_file
-                ),
+                MessageHandler(_UNEXPECTED_FILTER, handle_unexpected_file),
                 CommandHandler(
                     "profile", cancel_profile_creation
                 ),  # Cancel if user hits /profile again
             ],
+            ConversationHandler.TIMEOUT: [TypeHandler(Update, handle_timeout)],
         },
         fallbacks=[CommandHandler("cancel", cancel_profile_creation)],
+        name="profile_conversation",
+        persistent=True,
         per_chat=True,
         per_user=True,
+        conversation_timeout=CONVERSATION_TIMEOUT,
     )
@@ -1,3 +1,4 @@
 from .start import create_start_handler
 from .help import create_help_handler
 from .delete import create_deletegame_handler
+from .unblock import create_unblock_handler
@@ -2,10 +2,39 @@ from telegram import Update
 from telegram.ext import CommandHandler
 from telegram_bot.strategies import SimpleReplyStrategy
 from telegram_bot.models.game import GameManager
+from telegram_bot.utils import safe_send_many
 import logging
 
 logger = logging.getLogger(__name__)
 
+# fixed replies are built once; only the "error" status interpolates a detail
+_USAGE_REPLY = SimpleReplyStrategy(
+    "Please provide a game reference\n" "Usage: /delete <game_reference>"
+)
+_STATUS_REPLIES = {
+    status: SimpleReplyStrategy(message)
+    for status, message in {
+        "not_found": "❌ Game not found. Copy a game reference by tapping on it in the history message and try again.",
+        "not_in_game": "❌ You're not part of this game; To prevent griefing, you may only delete games you were a part of. Ask a player to help delete it instead!",
+        "already_requested": "⏳ You've already requested deletion on this game. It will be deleted if another player uses /delete on the same game.",
+        "deleted": "✅ Game deleted successfully",
+        "pending": "🗑️ Deletion request recorded! Need 1 more confirmation to delete the game: Another player must also use /delete on the same game.",
+    }.items()
+}
+
+
+async def _notify_players(
+    bot, game_manager: GameManager, player_ids, text: str
+) -> None:
+    """DM the same message to every reachable player concurrently."""
+    await safe_send_many(
+        bot,
+        ((player_id, text) for player_id in player_ids),
+        parse_mode="HTML",
+        blocked_users=game_manager.blocked_users,
+        on_unreachable=game_manager.mark_user_blocked,
+    )
+
 
 def create_deletegame_handler(game_manager: GameManager) -> CommandHandler:
     async def handle_delete_game(update: Update, context):
@@ -13,68 +42,37 @@ def create_deletegame_handler(game_manager: GameManager) -> CommandHandler:
         args = context.args
 
         if not args:
-            await SimpleReplyStrategy(
-                "Please provide a game reference\n" "Usage: /delete <game_reference>"
-            ).execute(update, context)
+            await _USAGE_REPLY.execute(update, context)
             return
 
         game_ref = args[0]
-        game = game_manager.get_game_by_reference(game_ref)
-
-        if game is None:
-            return await SimpleReplyStrategy(
-                "❌ Game not found. Copy a game reference by tapping on it in the history message and try again."
-            ).execute(update, context)
-
         result = game_manager.request_game_deletion(game_ref, user_id)
-        status_map = {
-            "not_found": "❌ Game not found",
-            "not_in_game": "❌ You're not part of this game; To prevent griefing, you may only delete games you were a part of. Ask a player to help delete it instead!",
-            "already_requested": "⏳ You've already requested deletion on this game. It will be deleted if another player uses /delete on the same game.",
-            "deleted": "✅ Game deleted successfully",
-            "pending": "🗑️ Deletion request recorded! Need 1 more confirmation to delete the game: Another player must also use /delete on the same game.",
-            "error": f"❌ Error: {result.get('error', 'Unknown error')}",
-        }
+        game = result.get("game")
 
         # if pending, let all involved players know a request was made via DM, and that they can attempt to delete it too
         if result["status"] == "pending":
-            for player_id in game.players.keys():
-                if player_id == user_id:
-                    # skip the user themselves for this
-                    continue
-                try:
-                    await context.bot.send_message(
-                        chat_id=player_id,
-                        parse_mode="HTML",
-                        text=f"A player has requested that the following game be deleted. If this is correct, please use /delete {game_ref} to confirm their deletion request.\n\n{str(game)}",
-                    )
-                except Exception as e:
-                    # Log error but continue with other players if one fails
-                    print(
-                        f"Failed to send game summary to player {player_id}: {str(e)}"
-                    )
-                    logger.warning(
-                        f"Failed to send game summary to player {player_id}: {str(e)}"
-                    )
+            # skip the user themselves for this
+            await _notify_players(
+                context.bot,
+                game_manager,
+                (player_id for player_id in game.players if player_id != user_id),
+                f"A player has requested that the following game be deleted. If this is correct, please use /delete {game_ref} to confirm their deletion request.\n\n{str(game)}",
+            )
 
         # if deleted, let all involved players know their games has been deleted via DM
         if result["status"] == "deleted":
-            for player_id in game.players.keys():
-                try:
-                    await context.bot.send_message(
-                        chat_id=player_id,
-                        parse_mode="HTML",
-                        text=f"A game you were a part of has been deleted.\n\n{str(game)}",
-                    )
-                except Exception as e:
-                    # Log error but continue with other players if one fails
-                    print(
-                        f"Failed to send game summary to player {player_id}: {str(e)}"
-                    )
-                    logger.warning(
-                        f"Failed to send game summary to player {player_id}: {str(e)}"
-                    )
+            await _notify_players(
+                context.bot,
+                game_manager,
+                game.players,
+                f"A game you were a part of has been deleted.\n\n{str(game)}",
+            )
 
-        await SimpleReplyStrategy(status_map[result["status"]]).execute(update, context)
+        reply = _STATUS_REPLIES.get(result["status"])
+        if reply is None:
+            reply = SimpleReplyStrategy(
+                f"❌ Error: {result.get('error', 'Unknown error')}"
+            )
+        await reply.execute(update, context)
 
     return CommandHandler("delete", handle_delete_game)
@@ -0,0 +1,20 @@
+from telegram import Update
+from telegram.ext import TypeHandler
+from telegram_bot.models import GameManager
+
+
+def create_unblock_handler(game_manager: GameManager) -> TypeHandler:
+    """Clear a user's blocked mark whenever they message the bot in private.
+
+    Register this in a group that runs before the command handlers (e.g. -1) so
+    every private update is seen, not just /start.
+    """
+
+    async def unblock(update: Update, context):
+        # any private message means the bot can DM this user again
+        chat = update.effective_chat
+        if chat is None or chat.type != "private" or update.effective_user is None:
+            return
+        game_manager.unmark_user_blocked(update.effective_user.id)
+
+    return TypeHandler(Update, unblock)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 import textwrap
 import os
@@ -9,7 +10,20 @@ logger = logging.getLogger(__name__)
 TICKERBIT_FONT_PATH = os.path.abspath("fonts/Tickerbit-regular.otf")
 
 
-@dataclass
+# Fonts and backgrounds never change between renders, so each worker builds them
+# once and reuses them; only the per-card avatar and text are drawn every time.
+@lru_cache(maxsize=None)
+def _tickerbit_font(size: int) -> ImageFont.FreeTypeFont:
+    # raises OSError if the font is missing; failures aren't cached
+    return ImageFont.truetype(TICKERBIT_FONT_PATH, size)
+
+
+@lru_cache(maxsize=None)
+def _default_font(size: float | None = None) -> ImageFont.ImageFont:
+    return ImageFont.load_default(size)
+
+
+@dataclass(slots=True)
 class StatCardData:
     name: str
     avatar_path: str | None
@@ -137,11 +151,22 @@ def create_circular_avatar(avatar: Image.Image, size: int) -> Image.Image:
     return square_avatar
 
 
-def create_stat_card(
-    data: StatCardData, width: int = 400, height: int = 200
-) -> Image.Image:
-    """Create a stat card for a player."""
+@lru_cache(maxsize=128)
+def _cached_circular_avatar(path: str, mtime_ns: int, size: int) -> Image.Image:
+    with Image.open(path) as avatar:
+        return create_circular_avatar(avatar, size)
+
+
+def load_circular_avatar(path: str, size: int) -> Image.Image:
+    """
+    Load and process an avatar from disk, reusing the decoded result when the same
+    file (keyed by path and modification time) is drawn again.
+    """
+    return _cached_circular_avatar(path, os.stat(path).st_mtime_ns, size)
+
 
+@lru_cache(maxsize=8)
+def _stat_card_background(width: int, height: int) -> Image.Image:
     # Create base card with alpha channel if you want semi-transparency
     # or just use 'RGB' with a black fill if you want it fully opaque.
     card = Image.new("RGBA", (width, height), (0, 0, 0, 0))
@@ -153,19 +178,29 @@ def create_stat_card(
         radius=20,
         fill=(30, 30, 30, 220),  # Adjust alpha or remove for fully opaque
     )
+    return card
+
+
+def create_stat_card(
+    data: StatCardData, width: int = 400, height: int = 200
+) -> Image.Image:
+    """Create a stat card for a player."""
+
+    card = _stat_card_background(width, height).copy()
+    draw = ImageDraw.Draw(card)
 
     # Attempt to load your Tickerbit font
     try:
-        name_font = ImageFont.truetype(TICKERBIT_FONT_PATH, 24)
-        stat_font = ImageFont.truetype(TICKERBIT_FONT_PATH, 32)
-        subtitle_font = ImageFont.load_default(16)
+        name_font = _tickerbit_font(24)
+        stat_font = _tickerbit_font(32)
+        subtitle_font = _default_font(16)
     except OSError as e:
         logger.error(f"Font not found: {e}")
         # Fallback if not found
         logger.warning("Font not found, using default font.")
-        name_font = ImageFont.load_default()
-        stat_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
+        name_font = _default_font()
+        stat_font = _default_font()
+        subtitle_font = _default_font()
 
     # Avatar
     avatar_size = 80
@@ -174,8 +209,7 @@ def create_stat_card(
 
     if data.avatar_path and os.path.exists(data.avatar_path):
         try:
-            avatar = Image.open(data.avatar_path)
-            circular_avatar = create_circular_avatar(avatar, avatar_size)
+            circular_avatar = load_circular_avatar(data.avatar_path, avatar_size)
             card.paste(circular_avatar, (avatar_x, avatar_y), circular_avatar)
         except Exception as e:
             logger.error(f"Failed to load avatar: {e}")
@@ -236,20 +270,16 @@ def create_stat_card(
     return card
 
 
-def create_leaderboard_image(
-    stat_cards: list[StatCardData],
-    title: str,
-    width: int = 400,
-    card_height: int = 200,
-    spacing: int = 20,
+@lru_cache(maxsize=32)
+def _leaderboard_background(
+    title: str, card_count: int, width: int, card_height: int, spacing: int
 ) -> Image.Image:
-    """Create a leaderboard image from multiple stat cards."""
-
+    """The leaderboard canvas with its title drawn, before any cards are pasted."""
     title_height = 60
     total_height = (
         title_height
-        + (len(stat_cards) * card_height)
-        + ((len(stat_cards) - 1) * spacing)
+        + (card_count * card_height)
+        + ((card_count - 1) * spacing)
         + spacing * 2  # top and bottom padding
     )
     total_width = width + 2 * spacing
@@ -263,9 +293,9 @@ def create_leaderboard_image(
     # choose font size for title based on length; or wrap text if needed
     font_size = 24 if len(title) < 20 else 18
     try:
-        title_font = ImageFont.truetype(TICKERBIT_FONT_PATH, font_size)
+        title_font = _tickerbit_font(font_size)
     except OSError:
-        title_font = ImageFont.load_default()
+        title_font = _default_font()
 
     # Title with stroke or just center it plainly
     title_x = total_width // 2
@@ -279,6 +309,22 @@ def create_leaderboard_image(
         fill=title_color,
         anchor="mt",  # Middle-top
     )
+    return image
+
+
+def create_leaderboard_image(
+    stat_cards: list[StatCardData],
+    title: str,
+    width: int = 400,
+    card_height: int = 200,
+    spacing: int = 20,
+) -> Image.Image:
+    """Create a leaderboard image from multiple stat cards."""
+
+    title_height = 60
+    image = _leaderboard_background(
+        title, len(stat_cards), width, card_height, spacing
+    ).copy()
 
     # Generate and paste cards
     y_offset = title_height + spacing
@@ -317,15 +363,15 @@ def create_player_stat_card(
 
     # 3. Load fonts
     try:
-        name_font = ImageFont.truetype(TICKERBIT_FONT_PATH, 24)
-        stat_font = ImageFont.truetype(TICKERBIT_FONT_PATH, 20)
-        badge_font = ImageFont.truetype(TICKERBIT_FONT_PATH, 14)
-        subtitle_font = ImageFont.load_default(12)
+        name_font = _tickerbit_font(24)
+        stat_font = _tickerbit_font(20)
+        badge_font = _tickerbit_font(14)
+        subtitle_font = _default_font(12)
     except OSError:
         # fallback to default if Tickerbit isn't found
-        name_font = ImageFont.load_default()
-        stat_font = ImageFont.load_default()
-        badge_font = ImageFont.load_default()
+        name_font = _default_font()
+        stat_font = _default_font()
+        badge_font = _default_font()
 
     # 4. Place the avatar on the left side
     avatar_size = 80
@@ -334,8 +380,7 @@ def create_player_stat_card(
 
     if data.avatar_path and os.path.exists(data.avatar_path):
         try:
-            avatar = Image.open(data.avatar_path)
-            circular_avatar = create_circular_avatar(avatar, avatar_size)
+            circular_avatar = load_circular_avatar(data.avatar_path, avatar_size)
             card.paste(circular_avatar, (avatar_x, avatar_y), circular_avatar)
         except Exception as e:
             logger.error(f"Failed to load avatar: {e}")
@@ -1,3 +1,3 @@
 from .unit_handler import UnitHandler
-from .game import GameManager, Game, GameOutcome
+from .game import GameManager, Game, GameOutcome, AddGameState
 from .strategies import ReplyStrategy, ErrorStrategy, ContextStrategy
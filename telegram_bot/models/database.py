@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from sqlalchemy import (
     create_engine,
+    event,
     Column,
     Integer,
     String,
@@ -8,9 +9,11 @@ from sqlalchemy import (
     BigInteger,
     ForeignKey,
     UniqueConstraint,
+    make_url,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 Base = declarative_base()
 
@@ -136,9 +139,58 @@ class GameDeletionRequest(Base):
     requester = relationship("PodPlayer", foreign_keys=[requester_id])
 
 
+class BlockedUser(Base):
+    """Users the bot can no longer DM (e.g. they blocked it or never started it)."""
+
+    __tablename__ = "blocked_users"
+
+    telegram_id = Column(BigInteger, primary_key=True)
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+
 # Database connection setup
-def init_db(db_url: str = "sqlite:///edh_games.db"):
+def init_db(db_url: str = "sqlite:///edh_games.db", pool_size: int = 10):
     """Initialize the database connection and create tables."""
-    engine = create_engine(db_url)
+    url = make_url(db_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # in-memory databases only exist within a single connection
+        engine = create_engine(
+            url,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+    else:
+        connect_args = (
+            {"check_same_thread": False, "timeout": 30}
+            if url.get_backend_name() == "sqlite"
+            else {}
+        )
+        engine = create_engine(
+            url,
+            pool_size=pool_size,
+            max_overflow=20,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            connect_args=connect_args,
+        )
+
+    if engine.dialect.name == "sqlite":
+
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_conn, _):
+            # WAL + NORMAL sync: one append per commit instead of several fsyncs,
+            # and readers no longer block the writer
+            cursor = dbapi_conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA cache_size=-20000")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.close()
+
     Base.metadata.create_all(engine)
     return sessionmaker(bind=engine)
@@ -1,11 +1,11 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 import random
-from sqlalchemy.orm import Session
-from hashids import Hashids
-from telegram_bot.utils import format_name
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session, selectinload
+from telegram_bot.utils import format_name, encode_ref, decode_ref
 import os
 import dotenv
 from .database import (
@@ -15,6 +15,7 @@ from .database import (
     PodPlayer,
     Elimination,
     Pod as DBPod,
+    BlockedUser,
     init_db,
 )
 
@@ -44,7 +45,7 @@ def get_random_kill_word():
     return random.choice(kill_words)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerStats:
     """Statistics for a player across all games."""
 
@@ -56,6 +57,16 @@ class PlayerStats:
     eliminations: int = 0
     games_played: int = 0
 
+    @property
+    def winrate(self) -> float:
+        """Fraction of games won; 0 if no games have been played."""
+        return self.wins / self.games_played if self.games_played > 0 else 0
+
+    @property
+    def eliminations_per_game(self) -> float:
+        """Average eliminations per game; 0 if no games have been played."""
+        return self.eliminations / self.games_played if self.games_played > 0 else 0
+
     def update_from_game(self, outcome: GameOutcome, eliminations: int = 0):
         """Update stats based on a game outcome."""
         self.games_played += 1
@@ -162,6 +173,8 @@ class Game:
     deletion_reference: Optional[str] = None  # Reference for game deletion
     description: Optional[str] = None
     _db_game: Optional[DBGame] = None
+    # rendered summary; only cached once finalized, since the game can't change after
+    _rendered: Optional[str] = field(default=None, repr=False, compare=False)
 
     def add_player(self, telegram_id: int, name: str):
         """Add a player to the game."""
@@ -181,8 +194,13 @@ class Game:
                 )
             self.eliminations[eliminated_id] = telegram_id
 
-    def finalize(self, session: Session):
-        """Save the game to database."""
+    def finalize(self, session: Session, salt: Optional[str] = None):
+        """Save the game to database.
+
+        Args:
+            session: Session to write the game with
+            salt: Salt for the deletion reference; defaults to DATABASE_SALT
+        """
         if self.finalized:
             return  # Already finalized, no need to do it again
 
@@ -263,8 +281,7 @@ class Game:
                 session.bulk_save_objects(eliminations)
 
             # Generate deletion reference
-            hashids = Hashids(salt=os.getenv("DATABASE_SALT"), min_length=6)
-            deletion_ref = hashids.encode(self.game_id)
+            deletion_ref = encode_ref(self.game_id, salt)
             self.deletion_reference = deletion_ref
 
             self._db_game.deletion_reference = deletion_ref
@@ -350,7 +367,15 @@ class Game:
 
     def __str__(self) -> str:
         """Return a string representation of the game."""
+        if self._rendered is not None:
+            return self._rendered
 
+        rendered = self._render()
+        if self.finalized:
+            self._rendered = rendered
+        return rendered
+
+    def _render(self) -> str:
         winners = [
             self.players[telegram_id]
             for telegram_id, outcome in self.outcomes.items()
@@ -406,16 +431,46 @@ class Game:
         return "\n".join(summary)
 
 
+@dataclass(slots=True)
+class AddGameState:
+    """Transient state of an in-progress game recording conversation."""
+
+    game: Game
+    added_players: List[int] = field(default_factory=list)
+    eliminated_players: Set[int] = field(default_factory=set)
+    current_player_id: Optional[int] = None
+    current_player_idx: int = 0
+    winners_count: int = 0
+
+
 class GameManager:
     """Manages games and player statistics."""
 
     def __init__(
-        self, db_url: str = "sqlite:///data/games.db", db_salt: str = "SECRET_SALT"
+        self,
+        db_url: str = "sqlite:///data/games.db",
+        db_salt: Optional[str] = None,
+        pool_size: int = 10,
     ):
-        """Initialize the game manager with a database connection."""
-        self.Session = init_db(db_url)
+        """Initialize the game manager with a database connection.
+
+        db_salt salts game deletion references; it defaults to DATABASE_SALT.
+        """
+        self.Session = init_db(db_url, pool_size=pool_size)
         self._session = self.Session()
-        self.hashids = Hashids(salt=db_salt, min_length=6)
+        self._db_salt = db_salt
+        self._blocked_users: Optional[Set[int]] = None
+        self._pod_versions: Dict[int, int] = {}
+        # pods and memberships only change through create_pod/create_player,
+        # which invalidate these
+        self._pods_cache: Optional[Dict[int, Pod]] = None
+        self._user_pods_cache: Dict[int, List[Pod]] = {}
+        # (telegram_id, pod_id) -> avatar path; dropped when the profile changes
+        self._avatar_cache: Dict[Tuple[int, int], Optional[str]] = {}
+        # (pod_id, since_date) -> (pod version, telegram_id -> stats)
+        self._stats_cache: Dict[
+            Tuple[int, Optional[datetime]], Tuple[int, Dict[int, PlayerStats]]
+        ] = {}
 
     def _reset_session(self):
         """Reset the session if it's in an invalid state."""
@@ -453,14 +508,32 @@ class GameManager:
 
     @property
     def pods(self) -> Dict[int, Pod]:
-        """Get all pods."""
+        """Get all pods; loaded once and cached until a pod or member is added."""
+        if self._pods_cache is None:
+
+            def query_func(session):
+                return {
+                    pod.pod_id: Pod.from_db_pod(pod)
+                    for pod in session.query(DBPod).options(
+                        selectinload(DBPod.players)
+                    )
+                }
 
-        def query_func(session):
-            return {
-                pod.pod_id: Pod.from_db_pod(pod) for pod in session.query(DBPod).all()
-            }
+            self._pods_cache = self._safe_query(query_func)
+        return self._pods_cache
 
-        return self._safe_query(query_func)
+    def _invalidate_pods(self):
+        """Drop cached pods and memberships after a write."""
+        self._pods_cache = None
+        self._user_pods_cache.clear()
+
+    def get_user_pods(self, telegram_id: int) -> List[Pod]:
+        """Get all pods a user has a profile in."""
+        if telegram_id not in self._user_pods_cache:
+            self._user_pods_cache[telegram_id] = [
+                pod for pod in self.pods.values() if telegram_id in pod.members
+            ]
+        return self._user_pods_cache[telegram_id]
 
     def add_game(self, game: Game):
         """Add a completed game and update player statistics."""
@@ -490,11 +563,12 @@ class GameManager:
                         )
 
                 # Now try to finalize the game
-                game.finalize(self._session)
+                game.finalize(self._session, self._db_salt)
                 self._session.flush()  # Ensure all changes are valid
 
             # If we get here, commit the transaction
             self._safe_commit()
+            self.bump_pod_version(game.pod_id)
 
         except Exception as e:
             self._session.rollback()
@@ -516,11 +590,53 @@ class GameManager:
         db_pod = DBPod(pod_id=pod_id, name=name)
         self._session.add(db_pod)
         self._safe_commit()
+        self._invalidate_pods()
 
         pod = Pod(id=pod_id, name=name)
         # self.pods[pod_id] = pod
         return pod
 
+    def pod_version(self, pod_id: int) -> int:
+        """Counter that changes whenever a pod's games or players change.
+
+        Used to key caches of rendered pod data so they invalidate on writes.
+        """
+        return self._pod_versions.get(pod_id, 0)
+
+    def bump_pod_version(self, pod_id: int):
+        """Mark a pod's games or players as changed."""
+        self._pod_versions[pod_id] = self._pod_versions.get(pod_id, 0) + 1
+
+    @property
+    def blocked_users(self) -> Set[int]:
+        """Telegram IDs the bot can't DM; loaded from the database on first access."""
+        if self._blocked_users is None:
+
+            def query_func(session):
+                return {
+                    telegram_id
+                    for (telegram_id,) in session.query(BlockedUser.telegram_id)
+                }
+
+            self._blocked_users = self._safe_query(query_func)
+        return self._blocked_users
+
+    def mark_user_blocked(self, telegram_id: int):
+        """Record that DMs to a user fail so future broadcasts skip them."""
+        if telegram_id in self.blocked_users:
+            return
+        self._session.merge(BlockedUser(telegram_id=telegram_id))
+        self._safe_commit()
+        self.blocked_users.add(telegram_id)
+
+    def unmark_user_blocked(self, telegram_id: int):
+        """Allow DMs to a user again, e.g. after they (re)start the bot."""
+        if telegram_id not in self.blocked_users:
+            return
+        self._session.query(BlockedUser).filter_by(telegram_id=telegram_id).delete()
+        self._safe_commit()
+        self.blocked_users.discard(telegram_id)
+
     def get_pod_members(self, pod_id: int) -> Set[int]:
         """Get all member IDs in a pod."""
         pod = self._session.query(DBPod).filter_by(pod_id=pod_id).first()
@@ -557,24 +673,70 @@ class GameManager:
         )
         self._session.add(pod_player)
         self._safe_commit()
+        self._invalidate_pods()
+        self.invalidate_avatar(telegram_id, pod_id)
+        self.bump_pod_version(pod_id)
 
         player_stats = PlayerStats(telegram_id=telegram_id, name=name)
 
         return player_stats
 
+    def update_player_profile(
+        self,
+        telegram_id: int,
+        pod_id: int,
+        name: Optional[str] = None,
+        avatar_url: Optional[str] = None,
+    ) -> bool:
+        """Update a player's name and/or avatar in a single UPDATE statement.
+
+        Returns:
+            True if the player exists and was updated
+        """
+        values = {}
+        if name:
+            values["name"] = name
+        if avatar_url:
+            values["avatar_url"] = avatar_url
+        if not values:
+            return False
+
+        result = self._session.execute(
+            update(PodPlayer)
+            .where(PodPlayer.telegram_id == telegram_id, PodPlayer.pod_id == pod_id)
+            .values(**values)
+        )
+        self._safe_commit()
+        if result.rowcount == 0:
+            return False
+        self.invalidate_avatar(telegram_id, pod_id)
+        self.bump_pod_version(pod_id)
+        return True
+
     def get_player_avatar(self, telegram_id: int, pod_id: int) -> Optional[str]:
         """Get the avatar path for a player in a pod."""
-        player = (
-            self._session.query(PodPlayer)
-            .filter_by(telegram_id=telegram_id, pod_id=pod_id)
-            .first()
-        )
-        return player.avatar_url if player else None
+        key = (telegram_id, pod_id)
+        if key not in self._avatar_cache:
+            player = (
+                self._session.query(PodPlayer)
+                .filter_by(telegram_id=telegram_id, pod_id=pod_id)
+                .first()
+            )
+            self._avatar_cache[key] = player.avatar_url if player else None
+        return self._avatar_cache[key]
+
+    def invalidate_avatar(self, telegram_id: int, pod_id: int) -> None:
+        """Forget the cached avatar path for a player in a pod."""
+        self._avatar_cache.pop((telegram_id, pod_id), None)
 
     def get_player_stats(
         self, telegram_id: int, pod_id: int, since_date: Optional[datetime] = None
     ) -> Optional[PlayerStats]:
         """Get a player's statistics by telegram_id and pod_id."""
+        if since_date is None:
+            # all-time stats come from the per-pod cache, recomputed only after a write
+            stats = self._get_cached_pod_stats(pod_id, None).get(telegram_id)
+            return replace(stats) if stats else None
 
         def query_func(session):
             player = (
@@ -621,6 +783,91 @@ class GameManager:
 
         return self._safe_query(query_func)
 
+    def get_pod_stats_bulk(
+        self, pod_id: int, since_date: Optional[datetime] = None
+    ) -> List[PlayerStats]:
+        """Get statistics for every player in a pod using aggregate queries.
+
+        Equivalent to calling get_player_stats for each pod member, but with a
+        fixed number of queries regardless of pod size or game count. Results are
+        cached until the pod next changes.
+        """
+        stats_by_player = self._get_cached_pod_stats(pod_id, since_date)
+        return [replace(stats) for stats in stats_by_player.values()]
+
+    def _get_cached_pod_stats(
+        self, pod_id: int, since_date: Optional[datetime]
+    ) -> Dict[int, PlayerStats]:
+        """Stats for every player in a pod keyed by telegram_id, cached per pod version."""
+        key = (pod_id, since_date)
+        version = self.pod_version(pod_id)
+        cached = self._stats_cache.get(key)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        stats_by_player = {
+            stats.telegram_id: stats
+            for stats in self._query_pod_stats(pod_id, since_date)
+        }
+        if since_date is not None:
+            # only the latest windowed cutoff per pod is worth keeping
+            for stale_key in [
+                k for k in self._stats_cache if k[0] == pod_id and k[1] is not None
+            ]:
+                del self._stats_cache[stale_key]
+        self._stats_cache[key] = (version, stats_by_player)
+        return stats_by_player
+
+    def _query_pod_stats(
+        self, pod_id: int, since_date: Optional[datetime]
+    ) -> List[PlayerStats]:
+        """Compute stats for every player in a pod with aggregate queries."""
+
+        def query_func(session):
+            results = (
+                session.query(GameResult.player_id, GameResult.outcome, func.count())
+                .join(GameResult.game)
+                .filter(DBGame.pod_id == pod_id)
+            )
+            eliminations = (
+                session.query(Elimination.eliminator_id, func.count())
+                .join(Elimination.game)
+                .filter(DBGame.pod_id == pod_id)
+            )
+            if since_date:
+                results = results.filter(DBGame.created_at >= since_date)
+                eliminations = eliminations.filter(DBGame.created_at >= since_date)
+            results = results.group_by(GameResult.player_id, GameResult.outcome)
+            eliminations = eliminations.group_by(Elimination.eliminator_id)
+            elim_counts = dict(eliminations.all())
+
+            stats_by_player = {
+                player.pods_player_id: PlayerStats(
+                    telegram_id=player.telegram_id,
+                    name=player.name,
+                    eliminations=elim_counts.get(player.pods_player_id, 0),
+                )
+                for player in session.query(PodPlayer)
+                .filter_by(pod_id=pod_id)
+                .order_by(PodPlayer.pods_player_id)
+            }
+
+            for player_id, outcome, count in results:
+                stats = stats_by_player.get(player_id)
+                if stats is None:
+                    continue
+                stats.games_played += count
+                if outcome == GameOutcome.WIN:
+                    stats.wins += count
+                elif outcome == GameOutcome.LOSE:
+                    stats.losses += count
+                else:  # DRAW
+                    stats.draws += count
+
+            return list(stats_by_player.values())
+
+        return self._safe_query(query_func)
+
     def get_player_games(
         self,
         telegram_id: int,
@@ -660,6 +907,24 @@ class GameManager:
         """Get a player by telegram_id and pod_id."""
         return self.get_player_stats(telegram_id, pod_id)
 
+    def get_pod_players_bulk(
+        self, telegram_ids: List[int], pod_id: int
+    ) -> Dict[int, PodPlayer]:
+        """Get several players of a pod in a single query, keyed by telegram_id."""
+
+        def query_func(session):
+            players = (
+                session.query(PodPlayer)
+                .filter(
+                    PodPlayer.pod_id == pod_id,
+                    PodPlayer.telegram_id.in_(telegram_ids),
+                )
+                .all()
+            )
+            return {player.telegram_id: player for player in players}
+
+        return self._safe_query(query_func)
+
     def get_player(self, telegram_id: int) -> Optional[Dict[int, PlayerStats]]:
         """Get all pod stats for a player by telegram_id."""
         players = (
@@ -715,18 +980,25 @@ class GameManager:
     def get_game_by_reference(self, deletion_reference: str) -> Optional[Game]:
         """Get game by its deletion reference."""
 
+        # malformed references can be rejected without touching the database
+        game_id = decode_ref(deletion_reference, self._db_salt)
+        if game_id is None:
+            return None
+
         def query_func(session):
-            db_game = (
-                session.query(DBGame)
-                .filter_by(deletion_reference=deletion_reference)
-                .first()
-            )
-            return Game.from_db_game(db_game) if db_game else None
+            db_game = session.get(DBGame, game_id)
+            if not db_game or db_game.deletion_reference != deletion_reference:
+                return None
+            return Game.from_db_game(db_game)
 
         return self._safe_query(query_func)
 
     def request_game_deletion(self, deletion_ref: str, requester_id: int) -> dict:
-        """Process game deletion request. Returns status object with result and details."""
+        """Process game deletion request. Returns status object with result and details.
+
+        Once the game has been found, the result also carries it under "game" so
+        callers don't need to look it up again.
+        """
         try:
             game = self.get_game_by_reference(deletion_ref)
             if not game:
@@ -739,7 +1011,7 @@ class GameManager:
                 .first()
             )
             if not pod_player:
-                return {"status": "not_in_game"}
+                return {"status": "not_in_game", "game": game}
 
             # Check existing requests
             existing = (
@@ -748,7 +1020,7 @@ class GameManager:
                 .first()
             )
             if existing:
-                return {"status": "already_requested"}
+                return {"status": "already_requested", "game": game}
 
             # Create new request
             self._session.add(
@@ -770,10 +1042,11 @@ class GameManager:
                 db_game = game._db_game
                 self._session.delete(db_game)
                 self._safe_commit()
-                return {"status": "deleted"}
+                self.bump_pod_version(game.pod_id)
+                return {"status": "deleted", "game": game}
 
             self._safe_commit()
-            return {"status": "pending"}
+            return {"status": "pending", "game": game}
 
         except Exception as e:
             self._session.rollback()
@@ -9,7 +9,7 @@ from telegram_bot.stats.leaderboard import (
     get_player_stats,
     generate_leaderboard_text,
     generate_stat_cards,
-    generate_leaderboard_image,
+    render_leaderboard_image,
 )
 
 logger = logging.getLogger(__name__)
@@ -59,14 +59,11 @@ class WeeklyRoundup:
                     stat_cards = generate_stat_cards(
                         active_players, self.game_manager, pod_id
                     )
-                    if stat_cards:
-                        image_bio = generate_leaderboard_image(
-                            stat_cards, pod.name, time_filter="week"
-                        )
-                        if image_bio:
-                            await context.bot.send_photo(
-                                chat_id=pod_id, photo=image_bio
-                            )
+                    image_bytes = await render_leaderboard_image(
+                        stat_cards, pod.name, time_filter="week"
+                    )
+                    if image_bytes:
+                        await context.bot.send_photo(chat_id=pod_id, photo=image_bytes)
 
                     # Generate and send detailed text stats
                     message = generate_leaderboard_text(
@@ -31,14 +31,14 @@ STAT_POOL = [
         "title": "Wins Leader",
         "stat_name": "Wins",
         "value_func": lambda stats: stats.wins,
-        "subtitle_func": lambda stats: f"{safe_division(stats.wins, stats.games_played, 0.0) * 100:.1f}% Win Rate"
+        "subtitle_func": lambda stats: f"{stats.winrate * 100:.1f}% Win Rate"
     },
     {
         "id": "kills_leader",
         "title": "Most Kills",
         "stat_name": "Kills",
         "value_func": lambda stats: stats.eliminations,
-        "subtitle_func": lambda stats: f"{safe_division(stats.eliminations, stats.games_played, 0.0):.1f} per game"
+        "subtitle_func": lambda stats: f"{stats.eliminations_per_game:.1f} per game"
     },
     {
         "id": "games_leader",
@@ -51,14 +51,14 @@ STAT_POOL = [
         "id": "winrate_leader",
         "title": "Best Win Rate",
         "stat_name": "Win Rate",
-        "value_func": lambda stats: safe_division(stats.wins, stats.games_played, 0.0) * 100,
+        "value_func": lambda stats: stats.winrate * 100,
         "subtitle_func": lambda stats: f"{stats.wins}W-{stats.losses}L"
     },
     {
         "id": "kills_per_game",
         "title": "Most Kills Per Game",
         "stat_name": "K/G",
-        "value_func": lambda stats: safe_division(stats.eliminations, stats.games_played, 0.0),
+        "value_func": lambda stats: stats.eliminations_per_game,
         "subtitle_func": lambda stats: f"{stats.eliminations} Total Kills"
     }
 ]
@@ -85,8 +85,8 @@ def pick_highlight_stats(
     if not active_players:
         return []
         
-    # Start with required stats if any
-    highlights = []
+    # Pick the stats to highlight, starting with required stats if any
+    chosen = []
     remaining_pool = list(stat_pool)
     
     if required_stats:
@@ -95,42 +95,32 @@ def pick_highlight_stats(
             stat_meta = next((s for s in remaining_pool if s["id"] == stat_id), None)
             if stat_meta:
                 remaining_pool.remove(stat_meta)
-                value_func = stat_meta["value_func"]
-                
-                # Find the top player for this stat
-                best_player = max(active_players, key=value_func)
-                best_value = value_func(best_player)
-                
-                highlights.append(StatHighlight(
-                    id=stat_meta["id"],
-                    title=stat_meta["title"],
-                    player=best_player,
-                    stat_value=best_value,
-                    stat_name=stat_meta["stat_name"],
-                    subtitle=stat_meta["subtitle_func"](best_player)
-                ))
+                chosen.append(stat_meta)
     
-    # Randomly pick remaining stats
+    # Randomly pick remaining stats until we have enough
     random.shuffle(remaining_pool)
+    chosen.extend(remaining_pool[:max(num_highlights - len(chosen), 0)])
     
-    # Add random stats until we have enough
-    for stat_meta in remaining_pool:
-        if len(highlights) >= num_highlights:
-            break
-            
-        value_func = stat_meta["value_func"]
-        
-        # Find the top player for this stat
-        best_player = max(active_players, key=value_func)
-        best_value = value_func(best_player)
-        
-        highlights.append(StatHighlight(
+    # Find the top player for every chosen stat in a single pass over the players;
+    # ties go to the earliest player, as with max()
+    value_funcs = [stat_meta["value_func"] for stat_meta in chosen]
+    best_players: List[Optional[PlayerStats]] = [None] * len(chosen)
+    best_values: List[Any] = [None] * len(chosen)
+    for player in active_players:
+        for i, value_func in enumerate(value_funcs):
+            value = value_func(player)
+            if best_players[i] is None or value > best_values[i]:
+                best_players[i] = player
+                best_values[i] = value
+    
+    return [
+        StatHighlight(
             id=stat_meta["id"],
             title=stat_meta["title"],
             player=best_player,
             stat_value=best_value,
             stat_name=stat_meta["stat_name"],
             subtitle=stat_meta["subtitle_func"](best_player)
-        ))
-    
-    return highlights
+        )
+        for stat_meta, best_player, best_value in zip(chosen, best_players, best_values)
+    ]
@@ -1,5 +1,9 @@
 """Leaderboard generation and display utilities."""
 
+import asyncio
+import multiprocessing
+import operator
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from io import BytesIO
@@ -10,12 +14,10 @@ from telegram_bot.stats.highlights import pick_highlight_stats
 
 # Sorting methods for leaderboard
 SORT_METHODS = {
-    "winrate": lambda stats: (
-        stats.wins / stats.games_played if stats.games_played > 0 else 0
-    ),
-    "wins": lambda stats: stats.wins,
-    "eliminations": lambda stats: stats.eliminations,
-    "games": lambda stats: stats.games_played,
+    "winrate": operator.attrgetter("winrate"),
+    "wins": operator.attrgetter("wins"),
+    "eliminations": operator.attrgetter("eliminations"),
+    "games": operator.attrgetter("games_played"),
 }
 
 SORT_TITLES = {
@@ -30,9 +32,19 @@ TIME_FILTERS = {
     "week": "Past Week",
 }
 
+# Rank labels for the top three places
+MEDALS = ("", "", "")
+
 # Stats that should always be included in highlights
 REQUIRED_STATS = ["winrate_leader"]
 
+# Worker processes for PIL rendering, created on first use. Spawned rather than
+# forked since the bot process runs threads (logging listener, job queue).
+# Each worker is a full interpreter re-importing telegram, SQLAlchemy and PIL,
+# and renders are infrequent, so keep the pool small.
+IMAGE_POOL_WORKERS = 2
+_image_pool: Optional[ProcessPoolExecutor] = None
+
 
 def get_player_stats(
     game_manager: GameManager,
@@ -51,18 +63,17 @@ def get_player_stats(
     Returns:
         Tuple of (active_players, inactive_players)
     """
-    players_stats = []
     cutoff_date = None
 
     if time_filter == "week":
-        cutoff_date = datetime.now() - timedelta(days=7)
+        # Rounded down to the hour so refreshes within the same hour share one
+        # cached result; the window may include up to an hour of extra games
+        cutoff_date = (datetime.now() - timedelta(days=7)).replace(
+            minute=0, second=0, microsecond=0
+        )
 
-    # Get stats for all players
-    for user_id in game_manager.get_pod_members(pod_id):
-        if stats := game_manager.get_player_stats(
-            user_id, pod_id, since_date=cutoff_date
-        ):
-            players_stats.append(stats)
+    # Get stats for all players in one go
+    players_stats = game_manager.get_pod_stats_bulk(pod_id, since_date=cutoff_date)
 
     # Split into active and inactive
     active_players = [p for p in players_stats if p.games_played > 0]
@@ -94,22 +105,21 @@ def generate_leaderboard_text(
     Returns:
         Formatted leaderboard text
     """
-    message = (
+    parts = [
         f"<b>{pod_name} Leaderboard</b>\n"
         f"<i>Sorted by {SORT_TITLES[sort_by]} ({TIME_FILTERS[time_filter]})</i>\n\n"
-    )
+    ]
 
     if not active_players and not inactive_players:
-        message += "No players in this pod yet!"
+        parts.append("No players in this pod yet!")
     elif not active_players:
-        message += "No games have been played in this pod yet!"
+        parts.append("No games have been played in this pod yet!")
     else:
         for i, stats in enumerate(active_players, 1):
-            winrate = stats.wins / stats.games_played * 100
-            medals = ["", "", ""]
-            rank = medals[i - 1] if i <= 3 else f"{i}."
+            winrate = stats.winrate * 100
+            rank = MEDALS[i - 1] if i <= len(MEDALS) else f"{i}."
 
-            message += (
+            parts.append(
                 f"{rank} <b>{stats.name}</b>\n"
                 f"   • Win Rate: <code>{winrate:.1f}%</code>\n"
                 f"   • Record: <code>{stats.wins}W-{stats.losses}L</code>\n"
@@ -118,11 +128,10 @@ def generate_leaderboard_text(
             )
 
         if inactive_players:
-            message += "\n<i>Inactive Players:</i>\n"
-            for player in inactive_players:
-                message += f"• {player.name}\n"
+            parts.append("\n<i>Inactive Players:</i>\n")
+            parts.extend(f"• {player.name}\n" for player in inactive_players)
 
-    return message
+    return "".join(parts)
 
 
 def generate_stat_cards(
@@ -184,13 +193,69 @@ def generate_leaderboard_image(
     if not stat_cards:
         return None
 
+    bio = BytesIO()
+    _save_leaderboard_png(stat_cards, pod_name, time_filter, bio)
+    bio.seek(0)
+
+    return bio
+
+
+def _save_leaderboard_png(
+    stat_cards: List[StatCardData], pod_name: str, time_filter: str, bio: BytesIO
+) -> None:
     image = create_leaderboard_image(
         stat_cards, f"{pod_name} Top Players ({TIME_FILTERS[time_filter]})"
     )
 
-    # Convert to bytes for sending
+    # Convert to bytes for sending. zlib level 1 encodes several times faster than
+    # PIL's default of 6 for a slightly larger file; Telegram recompresses anyway
+    image.save(bio, "PNG", compress_level=1)
+
+
+def _render_leaderboard_png(
+    stat_cards: List[StatCardData], pod_name: str, time_filter: str
+) -> Optional[bytes]:
+    """Render the leaderboard image to PNG bytes; runs in a worker process."""
+    if not stat_cards:
+        return None
+
     bio = BytesIO()
-    image.save(bio, "PNG")
-    bio.seek(0)
+    _save_leaderboard_png(stat_cards, pod_name, time_filter, bio)
+    return bio.getvalue()
 
-    return bio
+
+async def render_leaderboard_image(
+    stat_cards: List[StatCardData], pod_name: str, time_filter: str = "week"
+) -> Optional[bytes]:
+    """Generate the leaderboard image in a worker process.
+
+    Rendering is CPU-bound and mostly holds the GIL, so it runs in a process
+    pool to keep the event loop (and other handlers) responsive.
+
+    Returns:
+        PNG bytes, or None if there are no stat cards
+    """
+    global _image_pool
+
+    if not stat_cards:
+        return None
+
+    if _image_pool is None:
+        _image_pool = ProcessPoolExecutor(
+            max_workers=IMAGE_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _image_pool, _render_leaderboard_png, stat_cards, pod_name, time_filter
+    )
+
+
+def shutdown_image_pool() -> None:
+    """Stop the leaderboard render workers, if any were started."""
+    global _image_pool
+
+    if _image_pool is not None:
+        _image_pool.shutdown(wait=True, cancel_futures=True)
+        _image_pool = None
@@ -1,9 +1,11 @@
+from functools import lru_cache
 from typing import List, Dict
 from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton
 from telegram.ext import ContextTypes
 
 from telegram_bot.models import ReplyStrategy
 from telegram_bot.models.game import GameManager, GameOutcome
+from telegram_bot.models.database import PodPlayer
 from telegram_bot.utils import format_name
 
 
@@ -15,26 +17,16 @@ class PlayerSelectionReply(ReplyStrategy):
         self.game_manager = game_manager
         self.update = None
 
-    def _create_keyboard(self, added_players: List[int]) -> InlineKeyboardMarkup:
+    def _create_keyboard(
+        self, added_players: List[int], pod_players: Dict[int, PodPlayer]
+    ) -> InlineKeyboardMarkup:
         """Create keyboard with available players."""
         keyboard = []
-        chat_id = (
-            self.update.effective_chat.id
-            if self.update and self.update.effective_chat
-            else None
-        )
-
-        if not chat_id or chat_id not in self.game_manager.pods:
-            raise ValueError("Player selection should only be done in group chats.")
-
-        # Get players from the current pod if in a group chat
-        available_players = []
-
-        for member_id in self.game_manager.get_pod_members(chat_id):
-            if member_id not in added_players:
-                player = self.game_manager.get_pod_player(member_id, chat_id)
-                if player:
-                    available_players.append(player)
+        available_players = [
+            player
+            for member_id, player in pod_players.items()
+            if member_id not in added_players
+        ]
 
         for player in available_players:
             keyboard.append(
@@ -59,16 +51,23 @@ class PlayerSelectionReply(ReplyStrategy):
     async def execute(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Display player selection interface."""
         self.update = update
-        added_players = context.user_data.get("added_players", [])
-        keyboard = self._create_keyboard(added_players)
-        chat_id = update.effective_chat.id
+        added_players = context.user_data["add_game"].added_players
+        chat_id = (
+            update.effective_chat.id if update and update.effective_chat else None
+        )
+
+        if not chat_id or chat_id not in self.game_manager.pods:
+            raise ValueError("Player selection should only be done in group chats.")
+
+        # fetch every pod member in one query rather than once per button
+        members = self.game_manager.get_pod_members(chat_id)
+        pod_players = self.game_manager.get_pod_players_bulk(list(members), chat_id)
+        pod_players = {pid: pod_players[pid] for pid in members if pid in pod_players}
+        keyboard = self._create_keyboard(added_players, pod_players)
 
         message = "Select players to add to the game:"
         if added_players:
-            current_player_names = [
-                self.game_manager.get_pod_player(pid, chat_id).name
-                for pid in added_players
-            ]
+            current_player_names = [pod_players[pid].name for pid in added_players]
             message = (
                 "👥 Current players:\n\n"
                 + "\n".join(
@@ -95,8 +94,13 @@ class OutcomeSelectionReply(ReplyStrategy):
         super().__init__()
         self.game_manager = game_manager
 
-    def _create_keyboard(self, player_id: int) -> InlineKeyboardMarkup:
-        """Create keyboard with outcome options for a player."""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _create_keyboard(player_id: int) -> InlineKeyboardMarkup:
+        """Create keyboard with outcome options for a player.
+
+        The keyboard depends only on the player id, so it is built once and reused.
+        """
         keyboard = [
             [InlineKeyboardButton(f"🏆 Win", callback_data=f"outcome:{player_id}:win")],
             [
@@ -114,8 +118,9 @@ class OutcomeSelectionReply(ReplyStrategy):
 
     async def execute(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Display outcome selection interface."""
-        game = context.user_data["current_game"]
-        current_player_id = context.user_data["current_player_id"]
+        state = context.user_data["add_game"]
+        game = state.game
+        current_player_id = state.current_player_id
         player_name = game.players[current_player_id]
 
         keyboard = self._create_keyboard(current_player_id)
@@ -148,7 +153,7 @@ class EliminationSelectionReply(ReplyStrategy):
         self,
         available_players: List[int],
         current_player_id: int,
-        pod_id: int,
+        player_names: Dict[int, str],
         eliminated_list: list,
     ) -> InlineKeyboardMarkup:
         """Create keyboard with available players for elimination."""
@@ -156,11 +161,10 @@ class EliminationSelectionReply(ReplyStrategy):
         for pid in available_players:
             if not self.allow_self_elimination and pid == current_player_id:
                 continue
-            player = self.game_manager.get_pod_player(pid, pod_id)
             keyboard.append(
                 [
                     InlineKeyboardButton(
-                        player.name,
+                        player_names[pid],
                         callback_data=f"eliminate:{pid}",
                     )
                 ]
@@ -180,13 +184,13 @@ class EliminationSelectionReply(ReplyStrategy):
 
     async def execute(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Display elimination selection interface."""
-        game = context.user_data["current_game"]
-        current_player_id = context.user_data["current_player_id"]
-        eliminated_players = context.user_data.get("eliminated_players", [])
-        pod_id = update.effective_chat.id
+        state = context.user_data["add_game"]
+        game = state.game
+        current_player_id = state.current_player_id
+        eliminated_players = state.eliminated_players
 
         available_players = [
-            p for p in context.user_data["added_players"] if p not in eliminated_players
+            p for p in state.added_players if p not in eliminated_players
         ]
 
         if not self.allow_winner_elimination:
@@ -210,7 +214,7 @@ class EliminationSelectionReply(ReplyStrategy):
         )
 
         keyboard = self._create_keyboard(
-            available_players, current_player_id, pod_id, eliminated_list
+            available_players, current_player_id, game.players, eliminated_list
         )
 
         message = (
@@ -236,7 +240,7 @@ class GameSummaryReply(ReplyStrategy):
 
     async def execute(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Display game summary."""
-        game = context.user_data["current_game"]
+        game = context.user_data["add_game"].game
         game_summary = str(game)
         message = (
             f"Game summary:\n\n{game_summary}\n\n"
@@ -258,16 +262,15 @@ class WinnerSelectionReply(ReplyStrategy):
         self.game_manager = game_manager
 
     def _create_keyboard(
-        self, available_players: List[int], pod_id: int
+        self, available_players: List[int], player_names: Dict[int, str]
     ) -> InlineKeyboardMarkup:
         """Create keyboard with available players for winner selection."""
         keyboard = []
         for pid in available_players:
-            player = self.game_manager.get_pod_player(pid, pod_id)
             keyboard.append(
                 [
                     InlineKeyboardButton(
-                        player.name,
+                        player_names[pid],
                         callback_data=f"winner:{pid}",
                     )
                 ]
@@ -276,12 +279,12 @@ class WinnerSelectionReply(ReplyStrategy):
 
     async def execute(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Display winner selection interface."""
-        game = context.user_data["current_game"]
-        pod_id = update.effective_chat.id
+        state = context.user_data["add_game"]
+        game = state.game
 
-        # Get all players in the game
-        available_players = context.user_data["added_players"]
-        keyboard = self._create_keyboard(available_players, pod_id)
+        # Get all players in the game; their names were stored on the game when added
+        available_players = state.added_players
+        keyboard = self._create_keyboard(available_players, game.players)
 
         message = (
             "🏆 Select the winner of the game:\n"
@@ -87,16 +87,8 @@ class PlayerProfileReply(ReplyStrategy):
                 )
                 return
 
-        win_rate = (
-            (player_stats.wins / player_stats.games_played * 100)
-            if player_stats.games_played > 0
-            else 0
-        )
-        avg_eliminations = (
-            (player_stats.eliminations / player_stats.games_played)
-            if player_stats.games_played > 0
-            else 0
-        )
+        win_rate = player_stats.winrate * 100
+        avg_eliminations = player_stats.eliminations_per_game
 
         # Calculate decorative stat
         stat_value, stat_name = calculate_decorative_stat(
@@ -116,14 +108,10 @@ class PlayerProfileReply(ReplyStrategy):
                 "Draws": player_stats.draws,
                 "Total Kills": player_stats.eliminations,
                 "Win Rate": (
-                    f"{(player_stats.wins / player_stats.games_played * 100):.1f}%"
-                    if player_stats.games_played > 0
-                    else "0%"
+                    f"{win_rate:.1f}%" if player_stats.games_played > 0 else "0%"
                 ),
                 "Average Kills": (
-                    f"{(player_stats.eliminations / player_stats.games_played):.1f}"
-                    if player_stats.games_played > 0
-                    else "0"
+                    f"{avg_eliminations:.1f}" if player_stats.games_played > 0 else "0"
                 ),
             },
             decorative_stat_value=stat_value,
@@ -1,7 +1,16 @@
 """Utility functions for the bot."""
 
-from .rate_limit import safe_edit_message
+from .rate_limit import safe_edit_message, safe_send_message, safe_send_many
 from .save_avatar import save_avatar
 from .format_name import format_name
+from .deletion_reference import encode_ref, decode_ref
 
-__all__ = ["safe_edit_message", "save_avatar", "format_name"]
+__all__ = [
+    "safe_edit_message",
+    "safe_send_message",
+    "safe_send_many",
+    "save_avatar",
+    "format_name",
+    "encode_ref",
+    "decode_ref",
+]
@@ -0,0 +1,35 @@
+"""Encoding and decoding of game deletion references."""
+
+from functools import lru_cache
+from typing import Optional
+import os
+
+from hashids import Hashids
+
+
+@lru_cache(maxsize=4)
+def _get_hashids(salt: Optional[str]) -> Hashids:
+    # without an explicit salt, DATABASE_SALT is read lazily so the .env file has
+    # been loaded by the time the first reference is built
+    if salt is None:
+        salt = os.getenv("DATABASE_SALT")
+    return Hashids(salt=salt, min_length=6)
+
+
+@lru_cache(maxsize=4096)
+def encode_ref(game_id: int, salt: Optional[str] = None) -> str:
+    """Encode a game ID into its deletion reference.
+
+    The salt defaults to the DATABASE_SALT environment variable.
+    """
+    return _get_hashids(salt).encode(game_id)
+
+
+@lru_cache(maxsize=4096)
+def decode_ref(deletion_reference: str, salt: Optional[str] = None) -> Optional[int]:
+    """Decode a deletion reference into a game ID; None if it isn't valid.
+
+    The salt defaults to the DATABASE_SALT environment variable.
+    """
+    decoded = _get_hashids(salt).decode(deletion_reference)
+    return decoded[0] if len(decoded) == 1 else None
@@ -1,9 +1,9 @@
 """Rate limiting utilities for Telegram API calls."""
 import asyncio
 import logging
-from typing import Optional, Any, Callable
+from typing import Optional, Any, Callable, Collection, Iterable, Tuple
 from datetime import datetime, timedelta
-from telegram.error import RetryAfter, TimedOut
+from telegram.error import BadRequest, Forbidden, RetryAfter, TimedOut
 from telegram import Message
 
 logger = logging.getLogger(__name__)
@@ -11,6 +11,11 @@ logger = logging.getLogger(__name__)
 # Global rate limiting state
 _last_edit = datetime.now()
 MIN_EDIT_INTERVAL = 0.2  # seconds between edits
+_last_send = datetime.now()
+_send_lock = asyncio.Lock()
+MIN_SEND_INTERVAL = 1 / 30  # seconds between sends (Telegram allows ~30 msgs/sec)
+# caps in-flight sends so a large fan-out can't outrun the per-second budget
+_send_semaphore = asyncio.Semaphore(25)
 
 async def safe_edit_message(
     message: Message,
@@ -59,7 +64,12 @@ async def safe_edit_message(
             
             # Wait the required time plus a small buffer
             wait_time = e.retry_after + 0.1
-            logger.warning(f"Rate limited, waiting {wait_time}s before retry {attempt + 1}/{max_retries}")
+            logger.warning(
+                "Rate limited, waiting %ss before retry %s/%s",
+                wait_time,
+                attempt + 1,
+                max_retries,
+            )
             await asyncio.sleep(wait_time)
             
         except TimedOut:
@@ -68,11 +78,118 @@ async def safe_edit_message(
                 
             # Exponential backoff for timeouts
             wait_time = base_delay * (2 ** attempt)
-            logger.warning(f"Request timed out, waiting {wait_time}s before retry {attempt + 1}/{max_retries}")
+            logger.warning(
+                "Request timed out, waiting %ss before retry %s/%s",
+                wait_time,
+                attempt + 1,
+                max_retries,
+            )
             await asyncio.sleep(wait_time)
             
         except Exception as e:
-            logger.error(f"Failed to edit message: {str(e)}")
+            logger.error("Failed to edit message: %s", e)
             raise
 
     return None
+
+
+async def safe_send_message(
+    bot: Any,
+    chat_id: int,
+    text: str,
+    parse_mode: Optional[str] = None,
+    max_retries: int = 2,
+) -> Optional[Message]:
+    """
+    Send a message, spacing sends out to stay under Telegram's global rate limit.
+
+    At most 25 sends are in flight at once across all callers.
+
+    On RetryAfter the send waits the requested time and is retried rather than dropped.
+
+    Args:
+        bot: Bot used to send the message
+        chat_id: Chat to send the message to
+        text: Message text
+        parse_mode: Optional parse mode for text formatting
+        max_retries: Maximum number of attempts
+
+    Returns:
+        Sent message if successful, None if failed after retries
+    """
+    global _last_send
+
+    async with _send_semaphore:
+        for attempt in range(max_retries):
+            # Ensure minimum time between sends across all concurrent callers
+            async with _send_lock:
+                time_since_last = (datetime.now() - _last_send).total_seconds()
+                if time_since_last < MIN_SEND_INTERVAL:
+                    await asyncio.sleep(MIN_SEND_INTERVAL - time_since_last)
+                _last_send = datetime.now()
+
+            try:
+                return await bot.send_message(
+                    chat_id=chat_id, text=text, parse_mode=parse_mode
+                )
+
+            except RetryAfter as e:
+                if attempt == max_retries - 1:
+                    raise
+
+                wait_time = e.retry_after + 0.1
+                logger.warning(
+                    "Rate limited, waiting %ss before retry %s/%s",
+                    wait_time,
+                    attempt + 1,
+                    max_retries,
+                )
+                await asyncio.sleep(wait_time)
+
+        return None
+
+
+def _is_unreachable(error: BaseException) -> bool:
+    """Whether a send failed because the chat can't receive messages from the bot."""
+    return isinstance(error, Forbidden) or (
+        isinstance(error, BadRequest) and "chat not found" in error.message.lower()
+    )
+
+
+async def safe_send_many(
+    bot: Any,
+    messages: Iterable[Tuple[int, str]],
+    parse_mode: Optional[str] = None,
+    blocked_users: Collection[int] = (),
+    on_unreachable: Optional[Callable[[int], None]] = None,
+) -> None:
+    """
+    Send a batch of (chat_id, text) messages concurrently through safe_send_message.
+
+    A failure for one chat is logged and does not affect the others.
+
+    Args:
+        bot: Bot used to send the messages
+        messages: (chat_id, text) pairs to send
+        parse_mode: Optional parse mode for text formatting
+        blocked_users: Chats known to be unreachable; these are skipped
+        on_unreachable: Called with the chat_id of any chat the bot turns out
+            to be blocked by or unable to find
+    """
+    messages = [
+        (chat_id, text) for chat_id, text in messages if chat_id not in blocked_users
+    ]
+    results = await asyncio.gather(
+        *(
+            safe_send_message(bot, chat_id=chat_id, text=text, parse_mode=parse_mode)
+            for chat_id, text in messages
+        ),
+        return_exceptions=True,
+    )
+    for (chat_id, _), result in zip(messages, results):
+        if not isinstance(result, Exception):
+            continue
+        if on_unreachable is not None and _is_unreachable(result):
+            on_unreachable(chat_id)
+        # Log error but continue with other chats if one fails
+        logger.warning("Failed to send message to %s: %s", chat_id, result)
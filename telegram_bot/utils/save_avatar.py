@@ -1,18 +1,23 @@
+import asyncio
 import os
-from pathlib import Path
+import uuid
 import logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
-AVATAR_DIR = Path("data/avatars")
+AVATAR_DIR = "data/avatars"
 os.makedirs(AVATAR_DIR, exist_ok=True)
 
 
+def _write_avatar(filepath: str, data: bytes) -> None:
+    """Write the avatar, replacing any previous file at the same path atomically."""
+    # write to a temporary name first so readers never see a half-written file
+    tmp_path = f"{filepath}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, filepath)
+
+
 async def save_avatar(bot, photo, user_id: int, pod_id: int) -> str:
     """Save the user's avatar photo to disk.
 
@@ -30,11 +35,12 @@ async def save_avatar(bot, photo, user_id: int, pod_id: int) -> str:
     file = await bot.get_file(photo.file_id)
 
     # Create filename using user_id
-    filename = f"{user_id}_{pod_id}.jpg"
-    filepath = AVATAR_DIR / filename
+    filepath = f"{AVATAR_DIR}/{user_id}_{pod_id}.jpg"
 
-    # Download and save the file
-    await file.download_to_drive(custom_path=str(filepath))
+    # Download into memory, then write in a worker thread so disk I/O doesn't
+    # block the event loop
+    data = await file.download_as_bytearray()
+    await asyncio.to_thread(_write_avatar, filepath, bytes(data))
     logger.info(f"Avatar saved at {filepath}")
 
-    return str(filepath)
+    return filepath